@@ -0,0 +1,177 @@
+#!/usr/bin/python3
+
+"""
+This module contains the build step of the sprite atlas, a single image
+holding every move image pre-scaled to every size displayed by the GUI,
+along with an index of the offsets of all the sprites.
+
+Usage : python -m assets.atlas
+"""
+
+import json
+from hashlib import sha1
+from os.path import basename, getsize, exists
+from sys import stderr
+from PIL import Image
+from assets.resample import get_policy, scale_image
+
+
+def __digest__(image_url: str) -> str:
+    with open(image_url, "rb") as file:
+        return sha1(file.read()).hexdigest()
+
+
+def build_atlas(
+    image_urls: list,
+    scaling_factors: list,
+    atlas_url: str,
+    index_url: str,
+    name: str = None,
+):
+    """
+    This function resizes every image by every scaling factor using the
+    resampling policy with the given name (the default one if no name is
+    given), packs the resized images into one atlas image (one row per
+    scaling factor) and writes the index of the sprites, which records the
+    box of every sprite, the size and the hash of every source image and
+    the name of the policy.
+    """
+
+    name = name or get_policy()
+    rows = list()
+
+    for scaling_factor in scaling_factors:
+        row = list()
+        for image_url in image_urls:
+            with Image.open(image_url) as image:
+                row.append(scale_image(image.convert("RGBA"), scaling_factor, name))
+        rows.append(row)
+
+    width = max(sum(image.width for image in row) for row in rows)
+    height = sum(max(image.height for image in row) for row in rows)
+
+    atlas = Image.new("RGBA", (width, height))
+    sprites = list()
+    y = 0
+
+    for scaling_factor, row in zip(scaling_factors, rows):
+        x = 0
+        for image_url, image in zip(image_urls, row):
+            atlas.paste(image, (x, y))
+            sprites.append(
+                {
+                    "image": basename(image_url),
+                    "scaling_factor": scaling_factor,
+                    "box": [x, y, x + image.width, y + image.height],
+                }
+            )
+            x += image.width
+        y += max(image.height for image in row)
+
+    atlas.save(atlas_url, optimize=True)
+
+    index = {
+        "policy": name,
+        "sources": {
+            basename(image_url): {
+                "size": getsize(image_url),
+                "sha1": __digest__(image_url),
+            }
+            for image_url in image_urls
+        },
+        "sprites": sprites,
+    }
+
+    with open(index_url, "w") as file:
+        json.dump(index, file, indent=4)
+
+
+def is_stale(
+    image_urls: list, index_url: str, verify_hash: bool = False, name: str = None
+) -> bool:
+    """
+    This function checks whether the atlas has to be rebuilt, i.e. if the
+    index is missing, the atlas was built using another resampling policy
+    than the one with the given name (the default one if no name is given)
+    or any source image has changed since the build. By default only the
+    sizes of the source images are compared, the hashes are compared as
+    well if `verify_hash` is True.
+    """
+
+    if not exists(index_url):
+        return True
+
+    with open(index_url) as file:
+        index = json.load(file)
+
+    if index.get("policy") != (name or get_policy()):
+        return True
+
+    sources = index["sources"]
+
+    for image_url in image_urls:
+        source = sources.get(basename(image_url))
+
+        if source is None or not exists(image_url):
+            return True
+        if source["size"] != getsize(image_url):
+            return True
+        if verify_hash and source["sha1"] != __digest__(image_url):
+            return True
+
+    return False
+
+
+def load_atlas(image_urls: list, atlas_url: str, index_url: str) -> dict:
+    """
+    This function decodes the atlas once and crops all the sprites out of
+    it. It returns a dictionary mapping every pair of an image url and a
+    scaling factor to its PIL image, or an empty dictionary if the atlas is
+    missing or stale, e.g. built using another resampling policy than the
+    default one, in which case the images have to be resized from their
+    sources.
+    """
+
+    try:
+        if is_stale(image_urls, index_url) or not exists(atlas_url):
+            print("Sprite atlas is missing or stale", file=stderr)
+            return dict()
+
+        with open(index_url) as file:
+            index = json.load(file)
+
+        urls = {basename(image_url): image_url for image_url in image_urls}
+
+        with Image.open(atlas_url) as atlas:
+            atlas.load()
+            return {
+                (urls[sprite["image"]], sprite["scaling_factor"]): atlas.crop(
+                    tuple(sprite["box"])
+                )
+                for sprite in index["sprites"]
+                if sprite["image"] in urls
+            }
+    except BaseException as e:
+        print(e, file=stderr)
+        return dict()
+
+
+if __name__ == "__main__":
+    from constants.constants import (
+        rock_image_url,
+        paper_image_url,
+        scissor_image_url,
+        atlas_image_url,
+        atlas_index_url,
+        display_scaling_factors,
+    )
+
+    sources = [rock_image_url, paper_image_url, scissor_image_url]
+
+    if is_stale(sources, atlas_index_url, verify_hash=True) or not exists(
+        atlas_image_url
+    ):
+        build_atlas(sources, display_scaling_factors, atlas_image_url, atlas_index_url)
+        print(f"Built {atlas_image_url}")
+    else:
+        print(f"{atlas_image_url} is up to date")
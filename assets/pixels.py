@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+
+"""
+This module contains the on-disk cache of the decoded pixels of the move
+images. Every pair of an image and a scaling factor is stored as a small
+header followed by the raw RGBA pixels, which are memory-mapped and turned
+into PIL images without decoding or copying them.
+"""
+
+from hashlib import sha1
+from mmap import mmap, ACCESS_READ
+from os import makedirs, replace, stat
+from os.path import basename, join, exists
+from struct import Struct
+from sys import stderr
+from PIL import Image
+from assets.resample import get_policy, scale_image
+
+# Magic number, version, width, height, mode, modification time (ns) and
+# size of the source image, the hash of the source image and the name of
+# the resampling policy, padded to 64 bytes after which the pixels start
+header = Struct("<4sHHH4sqQ20s8s6x")
+magic = b"RPSP"
+version = 2
+mode = "RGBA"
+
+
+def __digest__(image_url: str) -> bytes:
+    with open(image_url, "rb") as file:
+        return sha1(file.read()).digest()
+
+
+def cache_file_url(cache_url: str, image_url: str, scaling_factor: float) -> str:
+    """
+    This function returns the path of the cache file of the image scaled by
+    the scaling factor.
+    """
+
+    return join(cache_url, f"{basename(image_url)}@{scaling_factor!r}.rgba")
+
+
+def build_pixels(image_url: str, scaling_factor: float, file_url: str, name: str):
+    """
+    This function decodes and resizes the image using the resampling policy
+    with the given name and writes its header and pixels to the cache file.
+    """
+
+    source = stat(image_url)
+
+    with Image.open(image_url) as image:
+        image = scale_image(image.convert(mode), scaling_factor, name)
+
+    # Writing to a temporary file first, so that a cache file is never seen
+    # half written
+    with open(file_url + ".tmp", "wb") as file:
+        file.write(
+            header.pack(
+                magic,
+                version,
+                image.width,
+                image.height,
+                mode.encode(),
+                source.st_mtime_ns,
+                source.st_size,
+                __digest__(image_url),
+                name.encode(),
+            )
+        )
+        file.write(image.tobytes())
+
+    replace(file_url + ".tmp", file_url)
+
+
+def __is_valid__(fields: tuple, image_url: str, file_url: str, name: str) -> bool:
+    """
+    This function checks the header of a cache file against the source
+    image and the resampling policy with the given name. The hash of the
+    source is only computed when its modification time or its size has
+    changed, and if only the modification time has changed (e.g. after a
+    fresh checkout) the header is updated, so that the hash is not computed
+    again on the next start.
+    """
+
+    (
+        file_magic,
+        file_version,
+        width,
+        height,
+        file_mode,
+        mtime_ns,
+        size,
+        digest,
+        file_policy,
+    ) = fields
+
+    if (file_magic, file_version, file_mode) != (magic, version, mode.encode()):
+        return False
+
+    # The name of the policy is padded with null bytes
+    if file_policy.rstrip(b"\0") != name.encode():
+        return False
+
+    source = stat(image_url)
+
+    if (source.st_mtime_ns, source.st_size) == (mtime_ns, size):
+        return True
+
+    if source.st_size != size or __digest__(image_url) != digest:
+        return False
+
+    with open(file_url, "r+b") as file:
+        file.write(
+            header.pack(
+                magic,
+                version,
+                width,
+                height,
+                file_mode,
+                source.st_mtime_ns,
+                size,
+                digest,
+                file_policy,
+            )
+        )
+
+    return True
+
+
+def load_pixels(
+    image_url: str, scaling_factor: float, cache_url: str, name: str = None
+):
+    """
+    This function returns the image scaled by the scaling factor as a PIL
+    image backed by the memory-mapped cache file. The cache file is built,
+    or rebuilt when the source image or the resampling policy (the default
+    one if no name is given) has changed, before being mapped.
+    """
+
+    name = name or get_policy()
+    makedirs(cache_url, exist_ok=True)
+    file_url = cache_file_url(cache_url, image_url, scaling_factor)
+
+    for attempt in range(2):
+        if not exists(file_url):
+            build_pixels(image_url, scaling_factor, file_url, name)
+
+        with open(file_url, "rb") as file:
+            data = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        fields = header.unpack_from(data)
+        width, height = fields[2], fields[3]
+
+        if (
+            __is_valid__(fields, image_url, file_url, name)
+            and len(data) == header.size + 4 * width * height
+        ):
+            # The image keeps a reference to the mapped memory
+            return Image.frombuffer(
+                mode,
+                (width, height),
+                memoryview(data)[header.size :],
+                "raw",
+                mode,
+                0,
+                1,
+            )
+
+        data.close()
+        build_pixels(image_url, scaling_factor, file_url, name)
+
+    raise RuntimeError(f"Invalid Pixel Cache [{file_url=}]")
+
+
+def load_all_pixels(image_urls: list, scaling_factors: list, cache_url: str) -> dict:
+    """
+    This function returns a dictionary mapping every pair of an image url
+    and a scaling factor to its memory-mapped image, or an empty dictionary
+    if the cache could not be used.
+    """
+
+    try:
+        return {
+            (image_url, scaling_factor): load_pixels(
+                image_url, scaling_factor, cache_url
+            )
+            for image_url in image_urls
+            for scaling_factor in scaling_factors
+        }
+    except BaseException as e:
+        print(e, file=stderr)
+        return dict()
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+
+"""
+This module contains the background preloading of the images of the
+playground. The images are decoded and resized by a worker thread while the
+starting screens are shown, and handed over to the tkinter thread through a
+queue which is polled using the `after` method of the root window, since
+tkinter images can only be created on the tkinter thread.
+"""
+
+from queue import Queue, Empty
+from sys import stderr
+from threading import Thread
+
+
+def load_sprite_images(
+    image_urls: list,
+    scaling_factors: list,
+    cache_url: str,
+    atlas_url: str,
+    index_url: str,
+) -> dict:
+    """
+    This function returns a dictionary mapping every pair of an image url
+    and a scaling factor to its PIL image, loaded from the memory-mapped
+    pixel cache, or from the sprite atlas if the cache cannot be used.
+    """
+
+    from assets.atlas import load_atlas
+    from assets.pixels import load_all_pixels
+
+    return load_all_pixels(image_urls, scaling_factors, cache_url) or load_atlas(
+        image_urls, atlas_url, index_url
+    )
+
+
+class Preloader:
+    """
+    Worker thread which calls `load` with the given arguments and puts every
+    item of the dictionary it returns into the `ready` queue, followed by
+    None once it is done. Exceptions raised by `load` are printed and end
+    the preloading, hence the images which are missing have to be loaded
+    on demand.
+    """
+
+    def __init__(self, load, *args):
+        self.ready = Queue()
+        self.done = False
+        self.thread = Thread(
+            target=self.__work__, args=(load, args), name="preloader", daemon=True
+        )
+
+    def __work__(self, load, args: tuple):
+        try:
+            for item in load(*args).items():
+                self.ready.put(item)
+        except BaseException as e:
+            print(e, file=stderr)
+        finally:
+            self.ready.put(None)
+
+    def start(self):
+        """
+        This method starts the worker thread.
+        """
+
+        self.thread.start()
+
+    def poll(self) -> list:
+        """
+        This method returns the items which are ready, without waiting for
+        the worker thread.
+        """
+
+        items = list()
+
+        while not self.done:
+            try:
+                item = self.ready.get_nowait()
+            except Empty:
+                break
+
+            if item is None:
+                self.done = True
+            else:
+                items.append(item)
+
+        return items
+
+    def wait(self) -> list:
+        """
+        This method waits for the worker thread to finish and returns all
+        the items which have not been polled yet.
+        """
+
+        items = list()
+
+        while not self.done:
+            item = self.ready.get()
+
+            if item is None:
+                self.done = True
+            else:
+                items.append(item)
+
+        return items
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+
+"""
+This module contains the resizing of the move images, which is shared by
+the GUI and the asset build steps.
+
+Large downscales are done in two steps, first a cheap reduction by a power
+of two (right while decoding, for the formats supporting draft mode such as
+JPEG, otherwise using `Image.reduce`) and then the final resampling of the
+much smaller image. The policy decides how close to the target size the
+cheap reduction may get and which filter is used for the final step.
+"""
+
+from PIL import Image
+
+# Every policy is a tuple of the gap, i.e. the minimum ratio between the
+# size after the reduction and the target size (None for no reduction),
+# and the filter of the final resampling
+policies = {
+    "quality": (None, Image.LANCZOS),
+    "balanced": (1.5, Image.LANCZOS),
+    "speed": (1, Image.BILINEAR),
+}
+
+policy = "balanced"
+
+
+def set_policy(name: str):
+    """
+    This function is used to select the policy used by default.
+    """
+
+    global policy
+
+    assert name in policies, f"Invalid Policy [{name=}]"
+
+    policy = name
+
+
+def get_policy() -> str:
+    """
+    This function returns the name of the policy used by default.
+    """
+
+    return policy
+
+
+def reduction_factor(size: tuple, target: tuple, name: str = None) -> int:
+    """
+    This function returns the largest power of two by which an image of the
+    given size can be reduced before being resampled to the target size
+    under the policy.
+    """
+
+    gap, _ = policies[name or policy]
+
+    if gap is None:
+        return 1
+
+    factor = 1
+
+    while all(
+        length // (2 * factor) >= gap * max(goal, 1)
+        for length, goal in zip(size, target)
+    ):
+        factor *= 2
+
+    return factor
+
+
+def scale_image(image, scaling_factor: float, name: str = None):
+    """
+    This function returns the image scaled by the scaling factor, keeping
+    the aspect ratio of the image constant, using the policy with the given
+    name or the default policy.
+    """
+
+    _, resample = policies[name or policy]
+    target = (int(image.width * scaling_factor), int(image.height * scaling_factor))
+    factor = reduction_factor(image.size, target, name)
+
+    if factor > 1:
+        # Decoding at a reduced scale is only supported by a few formats
+        # (and only before the image is loaded), otherwise this is a no-op
+        image.draft(image.mode, (image.width // factor, image.height // factor))
+
+        factor = reduction_factor(image.size, target, name)
+
+        if factor > 1:
+            image = image.reduce(factor)
+
+    return image.resize(target, resample)
@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+
+"""
+This module contains the validation of the assets of the game. It is run
+after the first frame is shown instead of at import time, hence a missing
+asset is reported without delaying the startup of the game.
+
+The assets can also be validated using `python -m assets.validation`.
+"""
+
+from os.path import exists
+from sys import stderr
+
+
+def missing_assets(assets: dict) -> list:
+    """
+    This function returns the names of the assets, out of a dictionary of
+    names and urls, which are not found at their url.
+    """
+
+    return [name for name, url in assets.items() if not exists(url)]
+
+
+def validate_assets(assets: dict, file=stderr) -> bool:
+    """
+    This function reports every missing asset to the file and returns True
+    if all the assets are found.
+    """
+
+    missing = missing_assets(assets)
+
+    for name in missing:
+        print(f"{name} Not Found [{assets[name]}]", file=file)
+
+    return not missing
+
+
+if __name__ == "__main__":
+    from constants.constants import required_assets
+
+    raise SystemExit(0 if validate_assets(required_assets) else 1)
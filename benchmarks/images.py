@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+
+"""
+Benchmark of the resize policies of the move images. For every asset, every
+displayed size and every policy it reports the time taken to decode and
+resize the image, the peak memory used meanwhile and the theoretical size
+of the pixel buffers involved (the decoded image, the image after the cheap
+reduction and the final image).
+
+The peak memory is the growth of the peak resident memory of a fresh process
+which decodes and resizes the image once. Unlike tracemalloc, it includes the
+pixel buffers, which Pillow allocates outside of the Python allocator. It is
+only measured on Linux, where the peak can be reset (see proc(5)).
+
+Usage : python -m benchmarks.images [--repeat N]
+"""
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os.path import basename
+from re import search
+from statistics import median
+from time import perf_counter_ns
+from PIL import Image
+from assets.resample import policies, reduction_factor, scale_image
+from constants.constants import (
+    rock_image_url,
+    paper_image_url,
+    scissor_image_url,
+    display_scaling_factors,
+)
+
+image_urls = (rock_image_url, paper_image_url, scissor_image_url)
+
+
+def memory_status(field: str) -> int:
+    """
+    This function returns the field of the memory status of the process in
+    kilobytes, e.g. VmRSS for the resident memory and VmHWM for its peak.
+    """
+
+    with open("/proc/self/status") as file:
+        return int(search(rf"{field}:\s+(\d+)", file.read()).group(1))
+
+
+def peak_memory(image_url: str, scaling_factor: float, policy: str) -> int:
+    """
+    This function decodes and resizes the image under the policy, and
+    returns the growth of the peak resident memory of the process in
+    kilobytes, or None if it can not be measured. It is meant to be called
+    in a fresh process, since the memory freed by Pillow is kept by the
+    process and reused by the following images.
+    """
+
+    try:
+        # Resetting the peak resident memory to the current one
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+
+        before = memory_status("VmRSS")
+    except OSError:
+        return None
+
+    with Image.open(image_url) as image:
+        scale_image(image, scaling_factor, policy)
+
+    return memory_status("VmHWM") - before
+
+
+def benchmark(image_url: str, scaling_factor: float, policy: str, repeat: int):
+    """
+    This function returns the median time in milliseconds, the peak memory
+    and the theoretical size of the pixel buffers in kilobytes of resizing
+    the image under the policy.
+    """
+
+    timings = list()
+
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        with Image.open(image_url) as image:
+            scaled = scale_image(image, scaling_factor, policy)
+        timings.append(perf_counter_ns() - start)
+
+    with Image.open(image_url) as image:
+        bands = len(image.getbands())
+        factor = reduction_factor(image.size, scaled.size, policy)
+        sizes = [image.size, scaled.size]
+
+        if factor > 1:
+            sizes.append((image.width // factor, image.height // factor))
+
+    buffers = sum(width * height * bands for width, height in sizes)
+
+    # Every image is resized once more in a process of its own
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+        peak = executor.submit(peak_memory, image_url, scaling_factor, policy)
+        peak = peak.result()
+
+    return median(timings) / 1e6, peak, buffers / 1024
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    arguments = parser.parse_args()
+
+    print(
+        f"{'image':<12} {'scale':>6} {'policy':<9} {'time (ms)':>10} "
+        f"{'peak (KB)':>10} {'buffers (KB)':>13}"
+    )
+
+    for image_url in image_urls:
+        for scaling_factor in display_scaling_factors:
+            for policy in policies:
+                time, peak, buffers = benchmark(
+                    image_url, scaling_factor, policy, arguments.repeat
+                )
+                peak = "-" if peak is None else peak
+                print(
+                    f"{basename(image_url):<12} {scaling_factor:>6.3f} "
+                    f"{policy:<9} {time:>10.2f} {peak:>10} {buffers:>13.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
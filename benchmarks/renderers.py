@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+
+"""
+Benchmark of the renderers of the playground. For every renderer it reports
+the number of tkinter windows of the playground and the median time taken
+to play a round, i.e. to submit a move, reveal both the moves, show the
+result and redraw the playground for the next round.
+
+The benchmark needs a display, e.g. `xvfb-run python -m benchmarks.renderers`.
+
+Usage : python -m benchmarks.renderers [--rounds N]
+"""
+
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter_ns
+from game import RockPaperScissorsGame
+from renderers.__renderers__ import renderers
+from events.layer2 import submit as events_submit_choice
+
+
+def count_windows(widget) -> int:
+    """
+    This function returns the number of windows of the widget, including
+    the widget itself.
+    """
+
+    return 1 + sum(map(count_windows, widget.winfo_children()))
+
+
+def benchmark(renderer: str, rounds: int) -> tuple:
+    """
+    This function plays the rounds using the renderer and returns the
+    number of windows and the median time of a round in milliseconds.
+    """
+
+    game = RockPaperScissorsGame(seed=0, reveal_delay=0, renderer=renderer)
+    gui = game.gui = renderers[renderer](game, 0)
+    game.engine.subscribe(gui.on_round_result)
+
+    gui.load_initial_window()
+    # The match never ends during the benchmark
+    game.state.number_of_rounds = rounds + 1
+    gui.load_playground()
+    gui.root.update()
+
+    if gui.player_side(1) == "left":
+        submit = events_submit_choice.on_click_left_button(gui)
+    else:
+        submit = events_submit_choice.on_click_right_button(gui)
+
+    timings = list()
+
+    for round_number in range(rounds):
+        start = perf_counter_ns()
+        gui.player_1_choice.set((1, 2, 4)[round_number % 3])
+        submit()
+        gui.root.update_idletasks()
+        gui.advance()
+        gui.root.update_idletasks()
+        timings.append(perf_counter_ns() - start)
+
+    windows = count_windows(gui.root)
+    gui.root.destroy()
+
+    return windows, median(timings) / 1e6
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    arguments = parser.parse_args()
+
+    print(f"{'renderer':<10} {'windows':>8} {'round (ms)':>11}")
+
+    for renderer in renderers:
+        windows, time = benchmark(renderer, arguments.rounds)
+        print(f"{renderer:<10} {windows:>8} {time:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+
+"""
+Benchmark of the startup of the game. The game is imported in a fresh
+interpreter under `python -X importtime`, and the modules which took the
+longest to import are reported along with the total import time, which is
+the part of the time till the first frame spent before any window exists.
+
+The time till the first frame itself is printed by the game when it is
+started using `python game.py --startup-report`.
+
+Usage : python -m benchmarks.startup [--top N] [--repeat N]
+"""
+
+from argparse import ArgumentParser
+from os.path import abspath, dirname
+from statistics import median
+from subprocess import run
+from sys import executable
+
+package_url = dirname(dirname(abspath(__file__)))
+
+
+def import_times(module: str) -> dict:
+    """
+    This function imports the module in a fresh interpreter and returns
+    the self and cumulative import time in microseconds of every module
+    imported along with it, as reported by `-X importtime`.
+    """
+
+    process = run(
+        [executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=package_url,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = dict()
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+
+    return times
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="game")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    runs = [import_times(arguments.module) for _ in range(arguments.repeat)]
+    times = {
+        name: (
+            median(run[name][0] for run in runs if name in run),
+            median(run[name][1] for run in runs if name in run),
+        )
+        for name in runs[0]
+    }
+
+    print(f"{'module':<40} {'self (ms)':>10} {'cumulative (ms)':>16}")
+
+    for name, (own, cumulative) in sorted(
+        times.items(), key=lambda item: -item[1][1]
+    )[: arguments.top]:
+        print(f"{name:<40} {own / 1000:>10.1f} {cumulative / 1000:>16.1f}")
+
+    print()
+    print(
+        f"{len(times)} modules imported in "
+        f"{times[arguments.module][1] / 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
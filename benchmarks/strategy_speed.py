@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+
+"""
+Micro-benchmark of the computer strategies. Every strategy plays against a
+stream of random moves and the time taken per move (i.e. one call of
+`next_move` and one call of `observe`) is reported in nanoseconds.
+
+Usage : python -m benchmarks.strategy_speed [--moves N] [strategy ...]
+        python benchmarks/strategy_speed.py [--moves N] [strategy ...]
+"""
+
+import sys
+from argparse import ArgumentParser
+from os.path import abspath, dirname
+from time import perf_counter_ns
+
+# Run as a script, i.e. `python benchmarks/strategy_speed.py`, the package is
+# not on the module search path
+if not __package__:
+    sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from strategies.__strategies__ import strategies, create_strategy
+
+
+def benchmark(name: str, number_of_moves: int, seed: int = 0) -> float:
+    """
+    This function returns the average time per move of the strategy with
+    the given name, in nanoseconds.
+    """
+
+    strategy = create_strategy(name, seed)
+    opponent_moves = create_strategy("random", seed + 1)
+    opponent_moves = [opponent_moves.next_move() for _ in range(number_of_moves)]
+
+    next_move, observe = strategy.next_move, strategy.observe
+
+    start = perf_counter_ns()
+    for move in opponent_moves:
+        next_move()
+        observe(move)
+    end = perf_counter_ns()
+
+    return (end - start) / number_of_moves
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("strategies", nargs="*", default=list(strategies))
+    parser.add_argument("--moves", type=int, default=100000)
+    arguments = parser.parse_args()
+
+    for name in arguments.strategies:
+        if name not in strategies:
+            parser.error(f"unknown strategy {name!r}")
+
+    width = max(map(len, arguments.strategies))
+
+    for name in arguments.strategies:
+        print(f"{name.ljust(width)} : {benchmark(name, arguments.moves):10.1f} ns/move")
+
+
+if __name__ == "__main__":
+    main()
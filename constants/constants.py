@@ -6,8 +6,7 @@ This module contains all the constants which are used in the game.
 
 from tkinter import CENTER
 from sys import stderr
-from os import getcwd
-from os.path import exists, join
+from os.path import abspath, dirname, join
 from functools import reduce
 
 try:
@@ -24,17 +23,22 @@ rock_unicode = "\u270a"
 paper_unicode = "\u270b"
 scissor_unicode = "\u270c"
 
-rock_image_url = reduce(join, [getcwd(), "images", "rock.png"])
-assert exists(rock_image_url), "Rock Image Not Found"
+# The assets are resolved relative to the package, so that the game can be
+# started from any working directory. They are validated after the first
+# frame is shown (see assets/validation.py) instead of at import time.
+package_url = dirname(dirname(abspath(__file__)))
 
-paper_image_url = reduce(join, [getcwd(), "images", "paper.png"])
-assert exists(paper_image_url), "Paper Image Not Found"
+rock_image_url = reduce(join, [package_url, "images", "rock.png"])
+paper_image_url = reduce(join, [package_url, "images", "paper.png"])
+scissor_image_url = reduce(join, [package_url, "images", "scissor.png"])
+background_image_url = reduce(join, [package_url, "images", "background_image.png"])
 
-scissor_image_url = reduce(join, [getcwd(), "images", "scissor.png"])
-assert exists(scissor_image_url), "Scissor Image Not Found"
-
-background_image_url = reduce(join, [getcwd(), "images", "background_image.png"])
-assert exists(background_image_url), "Background Image Not Found"
+required_assets = {
+    "Rock Image": rock_image_url,
+    "Paper Image": paper_image_url,
+    "Scissor Image": scissor_image_url,
+    "Background Image": background_image_url,
+}
 
 background_image_scaling_factor = 0.5
 
@@ -56,3 +60,40 @@ common_formatting_options = {
 }
 
 scaling_factor = 135 / 534
+
+# The sizes at which the move images are displayed and the sprite atlas
+# holding the move images pre-scaled to all of them (see assets/atlas.py)
+display_scaling_factors = (scaling_factor, 2 * scaling_factor)
+
+atlas_image_url = reduce(join, [package_url, "images", "atlas.png"])
+atlas_index_url = reduce(join, [package_url, "images", "atlas.json"])
+
+# The directory of the memory-mapped cache of the decoded move images
+# (see assets/pixels.py)
+pixel_cache_url = reduce(join, [package_url, "images", ".cache"])
+
+# The delays, in milliseconds, for which the moves of both the players are
+# revealed before the round is evaluated and the final round is shown before
+# the ending screen. The event loop keeps running meanwhile.
+reveal_delay = 1500
+ending_delay = 1000
+
+# The interval, in milliseconds, of the heartbeat measuring the stalls of the
+# event loop (see events/stall.py)
+stall_interval = 10
+
+# The interval, in milliseconds, at which the images preloaded in the
+# background are handed over to tkinter (see assets/preload.py)
+preload_interval = 50
+
+# The maximum number of frames drawn per second during an automatic match,
+# the rounds played in between the frames are never drawn
+autoplay_fps = 30
+
+# The longest match, in rounds, for which the odds of winning are shown, the
+# table of the odds of a match of N rounds holds (N + 1)^2 probabilities
+odds_limit = 1000
+
+# The number of rounds, as a multiple of the number of rounds of the match,
+# after which the simulated rounds of a match without a winner are stopped
+fast_forward_factor = 100
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+"""
+This module contains the precomputed outcome tables of the Rock, Paper and
+Scissors game. Since the moves are one-hot bit values, every pair of moves
+is mapped to a distinct index `first_move | second_move << 3`, which is used
+to look up the winner, the verdict and the status color of a round.
+"""
+
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from constants.colors_table import color
+except ImportError as e:
+    print(e, file=stderr)
+
+# Number of entries in every table, i.e. every pair of 3-bit moves
+table_size = 64
+
+# Winner stored in the tables for an invalid pair of moves
+invalid_outcome = 255
+
+verdicts = {
+    Moves.ROCK | Moves.PAPER: "Paper covers Rock",
+    Moves.ROCK | Moves.SCISSOR: "Rock crushes Scissor",
+    Moves.PAPER | Moves.SCISSOR: "Scissor cuts Paper",
+}
+
+beats = {
+    Moves.ROCK: Moves.SCISSOR,
+    Moves.PAPER: Moves.ROCK,
+    Moves.SCISSOR: Moves.PAPER,
+}
+
+beaten_by = {loser: winner for winner, loser in beats.items()}
+
+
+def outcome_index(first_move: int, second_move: int) -> int:
+    """
+    This function returns the index of a pair of moves in the outcome
+    tables.
+    """
+
+    return first_move | second_move << 3
+
+
+def __build_tables__():
+    """
+    This function builds the winner table (as bytes) and the outcome tables
+    of both the sides on which the computer might be playing.
+    """
+
+    winner = bytearray([invalid_outcome] * table_size)
+    outcome = {"left": [None] * table_size, "right": [None] * table_size}
+
+    for first_move in Moves:
+        for second_move in Moves:
+            index = outcome_index(first_move, second_move)
+
+            if first_move == second_move:
+                winner[index] = 0
+            elif beats[first_move] == second_move:
+                winner[index] = 1
+            else:
+                winner[index] = 2
+
+            verdict = verdicts.get(first_move | second_move, "It's a tie")
+
+            for side in outcome:
+                if not winner[index]:
+                    fg = color["lemon_yellow"]
+                elif (winner[index] == 1) == (side == "right"):
+                    fg = color["sky_blue"]
+                else:
+                    fg = color["lime_green"]
+
+                outcome[side][index] = (winner[index], verdict, fg)
+
+    return bytes(winner), {side: tuple(table) for side, table in outcome.items()}
+
+
+# winner_table[outcome_index(first, second)] is 0, 1 or 2, and
+# outcome_table[computer_side][outcome_index(first, second)] is a tuple of
+# the winner, the verdict and the color of the status label.
+winner_table, outcome_table = __build_tables__()
@@ -0,0 +1,22 @@
+#!/usr/bin/python3
+
+"""
+This module contains the constants representing the phases of a round
+played on the playground of the Rock, Paper and Scissor game.
+"""
+
+from enum import IntEnum
+
+
+class Phase(IntEnum):
+    """
+    This class contains constants representing the phases of a round. A
+    round is IDLE while the user chooses a move, the moves of both the
+    players are shown during REVEAL, the round is played during EVALUATE
+    and the last round of a match is shown during ENDING.
+    """
+
+    IDLE = 0
+    REVEAL = 1
+    EVALUATE = 2
+    ENDING = 3
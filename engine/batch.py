@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+
+"""
+This module contains the vectorized evaluation of many rounds at once, it is
+the batch counterpart of `MatchEngine.check` and is meant for replaying and
+analysing large amounts of rounds.
+"""
+
+from sys import stderr
+from typing import NamedTuple
+
+try:
+    import numpy as np
+    from constants.moves import Moves
+    from constants.outcomes import winner_table, table_size, invalid_outcome
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class BatchResult(NamedTuple):
+    """
+    This class represents the result of a batch of rounds.
+
+    `outcomes` contains 0, 1 or 2 for every round (with the same meaning as
+    `MatchEngine.check`), `first_scores` and `second_scores` contain the
+    cumulative scores after every round, starting from the initial scores
+    of the batch, and `finish_index` is the index of
+    the round in which one of the players reached `number_of_rounds` wins,
+    or -1 if that never happened.
+    """
+
+    outcomes: "np.ndarray"
+    first_scores: "np.ndarray"
+    second_scores: "np.ndarray"
+    finish_index: int
+
+
+_winner_table = np.frombuffer(winner_table, dtype=np.uint8)
+
+
+def evaluate_batch(
+    first_moves,
+    second_moves,
+    number_of_rounds: int = None,
+    first_score: int = 0,
+    second_score: int = 0,
+):
+    """
+    This function is used to evaluate many rounds in a single vectorized
+    pass. Both the arguments are integer arrays (or sequences) of `Moves`
+    values of the same length. The scores are counted from the given
+    scores, i.e. the batch may continue a match which is in progress.
+
+    This function returns a BatchResult.
+    """
+
+    first_moves = np.asarray(first_moves, dtype=np.uint16)
+    second_moves = np.asarray(second_moves, dtype=np.uint16)
+
+    assert first_moves.shape == second_moves.shape, "Shape Mismatch"
+
+    indices = first_moves | second_moves << 3
+
+    assert not len(indices) or indices.max() < table_size, "Invalid Move"
+
+    outcomes = _winner_table[indices]
+
+    assert not (outcomes == invalid_outcome).any(), "Invalid Move"
+    first_scores = np.cumsum(outcomes == 1, dtype=np.int64) + first_score
+    second_scores = np.cumsum(outcomes == 2, dtype=np.int64) + second_score
+
+    finish_index = -1
+
+    if number_of_rounds is not None and len(outcomes):
+        finished = (first_scores >= number_of_rounds) | (
+            second_scores >= number_of_rounds
+        )
+        index = int(np.argmax(finished))
+        if finished[index]:
+            finish_index = index
+
+    return BatchResult(outcomes, first_scores, second_scores, finish_index)
+
+
+def simulate_match(
+    state,
+    draw_first,
+    draw_second,
+    chunk_size: int = 1 << 16,
+    max_rounds: int = None,
+) -> int:
+    """
+    This function plays the remaining rounds of the match of the MatchState
+    using the vectorized evaluation, `chunk_size` rounds at a time, hence
+    the memory used does not depend upon the number of rounds. Both
+    `draw_first` and `draw_second` are called with the number of rounds
+    and return the moves of both the players for that many rounds, e.g.
+    the `draw` method of the memoryless strategies.
+
+    The state is updated as if every round had been played one at a time,
+    and the winner of the match is returned. The match is stopped without a
+    winner, i.e. None is returned, once `max_rounds` rounds have been played
+    in total, or as soon as a whole chunk is tied, since memoryless players
+    tying `chunk_size` rounds in a row (e.g. two players always playing the
+    same move) practically never stop tying.
+    """
+
+    assert state.number_of_rounds, "Number of rounds is not set"
+    assert chunk_size > 0, f"Invalid Chunk Size [{chunk_size=}]"
+
+    while state.winner is None:
+        size = chunk_size
+
+        if max_rounds is not None:
+            size = min(size, max_rounds - state.round_number)
+
+        if size <= 0:
+            break
+
+        first_moves = draw_first(size)
+        second_moves = draw_second(size)
+
+        result = evaluate_batch(
+            first_moves,
+            second_moves,
+            state.number_of_rounds,
+            state.first_score,
+            state.second_score,
+        )
+
+        last = result.finish_index if result.finish_index >= 0 else size - 1
+
+        state.round_number += last + 1
+        state.first_score = int(result.first_scores[last])
+        state.second_score = int(result.second_scores[last])
+        state.first_move = Moves(int(first_moves[last]))
+        state.second_move = Moves(int(second_moves[last]))
+
+        if state.first_score == state.number_of_rounds:
+            state.winner = 1
+        elif state.second_score == state.number_of_rounds:
+            state.winner = 2
+
+        if size == chunk_size and not result.outcomes.any():
+            break
+
+    return state.winner
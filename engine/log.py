@@ -0,0 +1,396 @@
+#!/usr/bin/python3
+
+"""
+This module contains the append-only log of the rounds played by the match
+engine. Every round is appended as a fixed-width record to the last segment
+file of a directory, and a new segment is started once a segment is full.
+
+The segments are read back by memory-mapping them, hence any round can be
+found by its index without reading, let alone parsing, the rounds before it.
+"""
+
+from bisect import bisect_left, bisect_right
+from mmap import mmap, ACCESS_READ
+from operator import attrgetter
+from os import fsync, listdir, makedirs
+from os.path import basename, getsize, join
+from struct import Struct
+from time import time_ns
+from typing import NamedTuple
+
+# Match id, round number, both the moves, outcome and the time at which the
+# round was played in nanoseconds since the epoch, as little-endian unsigned
+# integers padded to 24 bytes
+record = Struct("<QIBBBxQ")
+record_size = record.size
+
+# The offset of the outcome in a record
+outcome_offset = 14
+
+segment_prefix = "segment-"
+segment_suffix = ".log"
+
+
+class LogRecord(NamedTuple):
+    """
+    This class represents a single round of the log, where the moves are
+    the values of Moves and the outcome is the one returned by
+    MatchEngine.check.
+    """
+
+    match_id: int
+    round_number: int
+    first_move: int
+    second_move: int
+    outcome: int
+    timestamp: int
+
+
+def segment_urls(directory: str) -> list:
+    """
+    This function returns the paths of all the segment files of the log in
+    the directory, in the order in which they were written.
+    """
+
+    return [
+        join(directory, name)
+        for name in sorted(listdir(directory))
+        if name.startswith(segment_prefix) and name.endswith(segment_suffix)
+    ]
+
+
+def segment_url(directory: str, index: int) -> str:
+    """
+    This function returns the path of the segment file with the given index.
+    """
+
+    return join(directory, f"{segment_prefix}{index:08d}{segment_suffix}")
+
+
+class MatchLog:
+    """
+    Writer of the append-only log of rounds, which is a subscriber of the
+    match engine. The rounds are buffered in memory and flushed to the
+    segment file when the buffer is full, while the segment is synced to the
+    disk only once every `sync_interval` rounds, as syncing every round
+    would limit the log to a few hundred rounds per second.
+
+    The rounds written since the last sync may be lost if the machine
+    crashes, and a record torn by a crash is dropped on the next start.
+
+    A directory must only be written by a single log at a time. The match
+    ids then increase through the log, which the readers rely on to find
+    the rounds of a match, but this is not enforced, e.g. by locking.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_records: int = 1 << 22,
+        sync_interval: int = 4096,
+        buffer_size: int = 1 << 16,
+    ):
+        assert segment_records > 0, f"Invalid Segment Size [{segment_records=}]"
+        assert sync_interval > 0, f"Invalid Sync Interval [{sync_interval=}]"
+
+        makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.segment_records = segment_records
+        self.sync_interval = sync_interval
+        self.buffer_size = buffer_size
+        self.match_id = 0
+        self.file = None
+        self.unsynced = 0
+
+        urls = segment_urls(directory)
+
+        # The match id carries on from the last round of the log, so that the
+        # ids stay unique across the runs. The last segments may be empty,
+        # e.g. when the process died right after a rollover, before the
+        # buffered rounds were flushed.
+        for url in reversed(urls):
+            records = getsize(url) // record_size
+
+            if records:
+                with open(url, "rb") as file:
+                    file.seek((records - 1) * record_size)
+                    self.match_id = record.unpack(file.read(record_size))[0]
+                break
+
+        if urls:
+            name = basename(urls[-1])
+            self.segment = int(name[len(segment_prefix) : -len(segment_suffix)])
+            self.__open__(urls[-1])
+        else:
+            self.segment = 0
+            self.__open__(segment_url(directory, 0))
+
+    def __open__(self, url: str):
+        """
+        This method opens the segment for appending, after dropping any
+        torn record at its end.
+        """
+
+        with open(url, "ab") as file:
+            size = file.tell()
+            self.records = size // record_size
+
+            if size % record_size:
+                file.truncate(self.records * record_size)
+
+        self.file = open(url, "ab", buffering=self.buffer_size)
+
+    def begin_match(self) -> int:
+        """
+        This method is used to start logging a new match, the following
+        rounds are logged with a new match id, which is returned.
+        """
+
+        self.match_id += 1
+
+        return self.match_id
+
+    def append(
+        self,
+        round_number: int,
+        first_move: int,
+        second_move: int,
+        outcome: int,
+        timestamp: int = None,
+    ):
+        """
+        This method is used to append a round of the current match to the
+        log, the current time is used if no timestamp is given.
+        """
+
+        if self.records == self.segment_records:
+            self.sync()
+            self.file.close()
+            self.segment += 1
+            self.__open__(segment_url(self.directory, self.segment))
+
+        self.file.write(
+            record.pack(
+                self.match_id,
+                round_number,
+                first_move,
+                second_move,
+                outcome,
+                time_ns() if timestamp is None else timestamp,
+            )
+        )
+        self.records += 1
+        self.unsynced += 1
+
+        if self.unsynced == self.sync_interval:
+            self.sync()
+
+    def __call__(self, result):
+        """
+        This method appends the RoundResult handed over by the match engine.
+        """
+
+        self.append(
+            result.round_number, result.first_move, result.second_move, result.outcome
+        )
+
+    def sync(self):
+        """
+        This method is used to flush the buffered rounds and sync the
+        segment to the disk.
+        """
+
+        self.file.flush()
+        fsync(self.file.fileno())
+        self.unsynced = 0
+
+    def close(self):
+        """
+        This method is used to sync and close the log.
+        """
+
+        if self.file is not None and not self.file.closed:
+            self.sync()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+
+class LogReader:
+    """
+    Reader of the log of rounds, which memory-maps all the segments of the
+    directory. The rounds can be counted, indexed, sliced and iterated over
+    like a sequence, e.g. `reader[-10:]` returns the last ten rounds.
+
+    Only the rounds which were written when the reader was created are
+    read, and rounds still buffered by a writer are not seen.
+    """
+
+    def __init__(self, directory: str):
+        self.segments = list()
+        self.offsets = [0]
+
+        for url in segment_urls(directory):
+            records = getsize(url) // record_size
+
+            # Empty files can not be mapped
+            if not records:
+                continue
+
+            with open(url, "rb") as file:
+                data = mmap(file.fileno(), records * record_size, access=ACCESS_READ)
+
+            self.segments.append(data)
+            self.offsets.append(self.offsets[-1] + records)
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    def __locate__(self, index: int) -> tuple:
+        """
+        This method returns the segment holding the round with the given
+        index along with the offset of the round in the segment.
+        """
+
+        # The number of segments is small, hence a linear search is enough
+        segment = 0
+        while self.offsets[segment + 1] <= index:
+            segment += 1
+
+        return self.segments[segment], (index - self.offsets[segment]) * record_size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self.rounds(*index.indices(len(self))))
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("Round Index Out Of Range")
+
+        return LogRecord._make(record.unpack_from(*self.__locate__(index)))
+
+    def rounds(self, start: int = 0, stop: int = None, step: int = 1):
+        """
+        This method iterates over the rounds from `start` till `stop`,
+        reading them straight from the mapped segments.
+        """
+
+        stop = len(self) if stop is None else stop
+
+        if step != 1:
+            for index in range(start, stop, step):
+                yield self[index]
+            return
+
+        for segment, data in enumerate(self.segments):
+            first, last = self.offsets[segment], self.offsets[segment + 1]
+
+            if last <= start or stop <= first:
+                continue
+
+            begin = (max(start, first) - first) * record_size
+            end = (min(stop, last) - first) * record_size
+
+            for fields in record.iter_unpack(memoryview(data)[begin:end]):
+                yield LogRecord._make(fields)
+
+    def __iter__(self):
+        return self.rounds()
+
+    def match_rounds(self, match_id: int) -> range:
+        """
+        This method returns the range of the indices of the rounds of the
+        match, which is empty if the match is not in the log. The match is
+        found by a binary search, which relies on the match ids increasing
+        through the log, i.e. on the log having had a single writer.
+        """
+
+        key = attrgetter("match_id")
+
+        return range(
+            bisect_left(self, match_id, key=key), bisect_right(self, match_id, key=key)
+        )
+
+    def outcomes(self, start: int = 0, stop: int = None) -> bytes:
+        """
+        This method returns the outcomes of the rounds from `start` till
+        `stop` as bytes, which are sliced out of the mapped segments with
+        the stride of a record, e.g. `outcomes.count(1)` is the number of
+        rounds won by the first player.
+        """
+
+        stop = len(self) if stop is None else stop
+        parts = list()
+
+        for segment, data in enumerate(self.segments):
+            first, last = self.offsets[segment], self.offsets[segment + 1]
+
+            if last <= start or stop <= first:
+                continue
+
+            begin = (max(start, first) - first) * record_size
+            end = (min(stop, last) - first) * record_size
+
+            parts.append(data[begin + outcome_offset : end : record_size])
+
+        return b"".join(parts)
+
+    def arrays(self) -> list:
+        """
+        This method returns every segment as a NumPy structured array, which
+        views the mapped segment without copying it, so that billions of
+        rounds can be analysed in a vectorized way. The arrays have to be
+        deleted before the reader is closed.
+        """
+
+        # NumPy is only required for viewing the segments as arrays
+        import numpy as np
+
+        dtype = np.dtype(
+            {
+                "names": list(LogRecord._fields),
+                "formats": ["<u8", "<u4", "u1", "u1", "u1", "<u8"],
+                "offsets": [0, 8, 12, 13, 14, 16],
+                "itemsize": record_size,
+            }
+        )
+
+        return [np.frombuffer(data, dtype) for data in self.segments]
+
+    def close(self):
+        """
+        This method is used to unmap all the segments.
+        """
+
+        for data in self.segments:
+            data.close()
+
+        self.segments.clear()
+        self.offsets = [0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(description="Summary of a log of rounds")
+    parser.add_argument("directory", help="the directory of the log")
+    arguments = parser.parse_args()
+
+    with LogReader(arguments.directory) as reader:
+        print(f"{len(reader)} rounds in {len(reader.segments)} segments")
+
+        if len(reader):
+            print(f"Matches {reader[0].match_id} to {reader[-1].match_id}")
@@ -0,0 +1,283 @@
+#!/usr/bin/python3
+
+"""
+This module contains the headless match engine of the Rock, Paper and
+Scissors game. It does not depend upon tkinter, hence complete matches can
+be played without any window, e.g. for simulations, bots and servers.
+"""
+
+from typing import NamedTuple
+from constants.moves import Moves
+from constants.outcomes import winner_table, invalid_outcome
+from engine.state import MatchState
+from engine.rng import MoveSource
+from strategies.basic import RandomStrategy
+
+
+class RoundResult(NamedTuple):
+    """
+    This class represents the result of a single round which is handed
+    over to every subscriber of the match engine.
+    """
+
+    round_number: int
+    first_move: Moves
+    second_move: Moves
+    outcome: int
+    first_score: int
+    second_score: int
+    winner: int
+
+
+class MatchEngine:
+    """
+    Headless engine of a first-to-`number_of_rounds` match between two
+    players.
+    """
+
+    def __init__(self, number_of_rounds: int = None, source: MoveSource = None):
+        self.state = MatchState(number_of_rounds)
+        self._source = source
+        self.subscribers = list()
+
+    @property
+    def source(self) -> MoveSource:
+        """
+        The source of the random moves of the engine, which is created when
+        it is first used unless it is given.
+        """
+
+        if self._source is None:
+            self._source = MoveSource()
+
+        return self._source
+
+    @source.setter
+    def source(self, source: MoveSource):
+        self._source = source
+
+    @property
+    def number_of_rounds(self) -> int:
+        """
+        The number of wins required to win the match.
+        """
+
+        return self.state.number_of_rounds
+
+    @number_of_rounds.setter
+    def number_of_rounds(self, number_of_rounds: int):
+        self.state.number_of_rounds = number_of_rounds
+
+    @property
+    def winner(self) -> int:
+        """
+        The winner of the match, None while the match is not over.
+        """
+
+        return self.state.winner
+
+    def reset(self):
+        """
+        This method is used to reset the scores of both the players so that
+        a new match can be played using the same engine.
+        """
+
+        self.state.reset()
+
+    def subscribe(self, subscriber):
+        """
+        This method is used to register a callable which will be called with
+        a RoundResult after every round played through `play_round`.
+        """
+
+        self.subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber):
+        """
+        This method is used to remove a previously registered subscriber.
+        """
+
+        self.subscribers.remove(subscriber)
+
+    @staticmethod
+    def check(first_move: Moves, second_move: Moves) -> int:
+        """
+        This method is used to obtain the result of a single round by
+        comparing the moves from both the parties.
+
+        This method returns either 0, 1 or 2 where 0 represents a tie,
+        1 represents that the first player is the winner of the current
+        round and 2 represents that the second player is the winner of
+        the current round.
+
+        This method also returns -1 when the move of the first player is
+        missing and -2 when the move of the second player is missing.
+        """
+
+        if first_move is None:
+            return -1
+
+        if second_move is None:
+            return -2
+
+        winner = winner_table[first_move | second_move << 3]
+
+        assert (
+            winner != invalid_outcome
+        ), f"Invalid Move [{first_move=}, {second_move=}]"
+
+        return winner
+
+    def generate_next_move(self) -> Moves:
+        """
+        This method is used to generate a random move.
+        """
+
+        return self.source.next_move()
+
+    def play_round(self, first_move: Moves, second_move: Moves) -> RoundResult:
+        """
+        This method is used to play a single round, update the scores and
+        notify all the subscribers about the result of the round.
+        """
+
+        state = self.state
+
+        assert state.winner is None, "Match is already over"
+
+        outcome = self.check(first_move, second_move)
+
+        assert outcome >= 0, f"Missing Move [{outcome=}]"
+
+        state.round_number += 1
+        state.first_move = first_move
+        state.second_move = second_move
+
+        if outcome == 1:
+            state.first_score += 1
+            if state.first_score == state.number_of_rounds:
+                state.winner = 1
+        elif outcome == 2:
+            state.second_score += 1
+            if state.second_score == state.number_of_rounds:
+                state.winner = 2
+
+        result = RoundResult(
+            state.round_number,
+            first_move,
+            second_move,
+            outcome,
+            state.first_score,
+            state.second_score,
+            state.winner,
+        )
+
+        for subscriber in self.subscribers:
+            subscriber(result)
+
+        return result
+
+    def play_match(
+        self,
+        first_player=None,
+        second_player=None,
+        max_rounds: int = None,
+        notify: bool = True,
+    ) -> int:
+        """
+        This method is used to play a complete match, from the current score
+        till one of the players reaches `number_of_rounds` wins, and returns
+        the winner (i.e. either 1 or 2).
+
+        Both the players are strategies, by default random moves are played.
+        If `max_rounds` is given then the match is stopped after that many
+        rounds in total, in which case None is returned if there is no
+        winner yet. When there are no subscribers, or they are not to be
+        notified, the rounds are played in a tight loop without building any
+        RoundResult, which allows millions of rounds per second.
+        """
+
+        state = self.state
+
+        assert state.number_of_rounds, "Number of rounds is not set"
+
+        if state.winner is not None:
+            return state.winner
+
+        first_player = first_player or RandomStrategy(self.source.substream(1))
+        second_player = second_player or RandomStrategy(self.source.substream(2))
+
+        first_next_move, first_observe = first_player.next_move, first_player.observe
+        second_next_move, second_observe = (
+            second_player.next_move,
+            second_player.observe,
+        )
+
+        # A negative limit is never reached, i.e. the rounds are unlimited
+        limit = -1 if max_rounds is None else max(0, max_rounds - state.round_number)
+
+        if self.subscribers and notify:
+            rounds = 0
+            while state.winner is None and rounds != limit:
+                first_move = first_next_move()
+                second_move = second_next_move()
+                first_observe(second_move)
+                second_observe(first_move)
+                self.play_round(first_move, second_move)
+                rounds += 1
+            return state.winner
+
+        # Invalid moves map to the invalid outcome, which is out of the
+        # bounds of the score list and thus raises an IndexError
+        table = winner_table
+        target = state.number_of_rounds
+        score = [0, state.first_score, state.second_score]
+        first_move, second_move = state.first_move, state.second_move
+        rounds = 0
+
+        while score[1] < target and score[2] < target and rounds != limit:
+            first_move = first_next_move()
+            second_move = second_next_move()
+            first_observe(second_move)
+            second_observe(first_move)
+            score[table[first_move | second_move << 3]] += 1
+            rounds += 1
+
+        state.round_number += rounds
+        state.first_score, state.second_score = score[1], score[2]
+        state.first_move, state.second_move = first_move, second_move
+
+        if score[1] == target:
+            state.winner = 1
+        elif score[2] == target:
+            state.winner = 2
+
+        return state.winner
+
+    def fast_forward(
+        self, first_player, second_player, max_rounds: int = None
+    ) -> int:
+        """
+        This method is used to play all the remaining rounds of the match at
+        once, without notifying the subscribers, and returns the winner. As
+        in `play_match`, None is returned if there is no winner after
+        `max_rounds` rounds in total, which should be given unless the
+        players are known to beat each other.
+
+        If both the players are memoryless strategies, the rounds are played
+        by the vectorized engine in chunks, otherwise one at a time as in
+        `play_match`. Either way the memory used does not depend upon the
+        number of rounds.
+        """
+
+        if first_player.memoryless and second_player.memoryless:
+            from engine.batch import simulate_match
+
+            return simulate_match(
+                self.state,
+                first_player.draw,
+                second_player.draw,
+                max_rounds=max_rounds,
+            )
+
+        return self.play_match(first_player, second_player, max_rounds, notify=False)
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+
+"""
+This module contains the exact probabilities of winning a first-to-N match
+from any score, given the probabilities of winning, tying and losing a
+single round. They are computed by dynamic programming over all the scores
+of the match, once for every match, instead of estimating them by playing
+many matches.
+"""
+
+from array import array
+from functools import lru_cache
+
+
+def first_probability(win: float, loss: float) -> float:
+    """
+    This function returns the probability that the first player wins a
+    round given that the round is not a tie. Ties do not change the score,
+    hence they do not change the probabilities of winning the match either.
+    """
+
+    assert win >= 0 and loss >= 0, f"Invalid Probabilities [{win=}, {loss=}]"
+    assert win + loss > 0, "Every round is a tie"
+
+    return win / (win + loss)
+
+
+@lru_cache(maxsize=16)
+def odds_table(number_of_rounds: int, probability: float) -> array:
+    """
+    This function returns the table of the probabilities that the first
+    player wins the match, where `probability` is the probability that the
+    first player wins a round which is not a tie. The table is a flat array
+    of (N + 1) * (N + 1) entries indexed by `first_score * (N + 1) +
+    second_score`, where N is the number of rounds.
+
+    The table is filled backwards from the final scores in O(N^2) time and
+    cached for the most recently used matches.
+    """
+
+    assert number_of_rounds > 0, "Invalid Number Of Rounds"
+    assert 0 <= probability <= 1, f"Invalid Probability [{probability=}]"
+
+    size = number_of_rounds + 1
+    table = array("d", bytes(8 * size * size))
+    other = 1 - probability
+
+    # The first player has already won once it reaches N wins, and lost once
+    # the second player does (which is the default value of the table)
+    last = number_of_rounds * size
+    for second_score in range(number_of_rounds):
+        table[last + second_score] = 1.0
+
+    for first_score in range(number_of_rounds - 1, -1, -1):
+        row = first_score * size
+        below = row + size
+
+        for second_score in range(number_of_rounds - 1, -1, -1):
+            table[row + second_score] = (
+                probability * table[below + second_score]
+                + other * table[row + second_score + 1]
+            )
+
+    return table
+
+
+def win_probability(
+    number_of_rounds: int,
+    win: float,
+    loss: float,
+    first_score: int = 0,
+    second_score: int = 0,
+) -> float:
+    """
+    This function returns the probability that the first player wins the
+    match from the given score, where `win` and `loss` are the probabilities
+    that the first player wins or loses a single round (the remaining
+    probability being a tie). The probability that the second player wins
+    the match is the complement, since a match only ends with a winner.
+    """
+
+    assert 0 <= first_score <= number_of_rounds, f"Invalid Score [{first_score=}]"
+    assert 0 <= second_score <= number_of_rounds, f"Invalid Score [{second_score=}]"
+
+    table = odds_table(number_of_rounds, first_probability(win, loss))
+
+    return table[first_score * (number_of_rounds + 1) + second_score]
@@ -0,0 +1,191 @@
+#!/usr/bin/python3
+
+"""
+This module contains the seekable replay of a match from the log of rounds
+(see engine/log.py). The state of the match is snapshotted every `interval`
+rounds, and the snapshots are saved in an index file next to the log, so
+that the state at any round is found by replaying at most `interval` rounds
+from the last snapshot before it, however long the match is.
+"""
+
+from os import replace
+from os.path import join, exists, getsize
+from struct import Struct
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from engine.log import LogReader
+    from engine.state import MatchState
+except ImportError as e:
+    print(e, file=stderr)
+
+# Magic number, version, match id, index of the first round of the match in
+# the log, number of rounds of the match and the interval of the snapshots,
+# after which the snapshots follow as MatchState records
+header = Struct("<4sHxxQQQI4x")
+magic = b"RPSI"
+version = 1
+
+
+def index_url(directory: str, match_id: int) -> str:
+    """
+    This function returns the path of the index file of the match.
+    """
+
+    return join(directory, f"index-{match_id:08d}.idx")
+
+
+class MatchReplay:
+    """
+    Seekable replay of a single match of the log, the last match by default.
+
+    The log does not hold the number of wins required to win the match, so
+    it is taken to be the highest final score, which is right for every
+    match which was played till the end. The log must have had a single
+    writer (see MatchLog), so that the rounds of the match are contiguous.
+    """
+
+    def __init__(self, directory: str, match_id: int = None, interval: int = 1024):
+        assert interval > 0, f"Invalid Interval [{interval=}]"
+
+        self.reader = LogReader(directory)
+
+        assert len(self.reader), f"Empty Log [{directory=}]"
+
+        if match_id is None:
+            match_id = self.reader[-1].match_id
+
+        rounds = self.reader.match_rounds(match_id)
+
+        self.match_id = match_id
+        self.start = rounds.start
+        self.rounds = len(rounds)
+
+        assert self.rounds, f"Unknown Match [{match_id=}]"
+
+        self.url = index_url(directory, match_id)
+        self.interval = interval
+        self.snapshots = self.__load__() or self.__build__()
+
+        self.number_of_rounds = None
+        last = self.seek(self.rounds)
+        self.number_of_rounds = max(last.first_score, last.second_score) or None
+
+    def __load__(self) -> bytes:
+        """
+        This method returns the snapshots saved in the index file, or None if
+        there is no index file or it does not match the log, e.g. because
+        more rounds of the match have been logged since.
+        """
+
+        if not exists(self.url) or getsize(self.url) < header.size:
+            return None
+
+        with open(self.url, "rb") as file:
+            data = file.read()
+
+        if header.unpack_from(data) != (
+            magic,
+            version,
+            self.match_id,
+            self.start,
+            self.rounds,
+            self.interval,
+        ):
+            return None
+
+        snapshots = data[header.size :]
+
+        if len(snapshots) != MatchState.record_size * (
+            self.rounds // self.interval + 1
+        ):
+            return None
+
+        return snapshots
+
+    def __build__(self) -> bytes:
+        """
+        This method replays the whole match once, snapshotting its state
+        every `interval` rounds, and saves the snapshots in the index file.
+        """
+
+        state = MatchState()
+        snapshots = [state.to_bytes()]
+
+        for round_number in range(
+            self.interval, self.rounds + 1, self.interval
+        ):
+            outcomes = self.reader.outcomes(
+                self.start + state.round_number, self.start + round_number
+            )
+            record = self.reader[self.start + round_number - 1]
+
+            state.first_score += outcomes.count(1)
+            state.second_score += outcomes.count(2)
+            state.round_number = round_number
+            state.first_move = record.first_move
+            state.second_move = record.second_move
+            snapshots.append(state.to_bytes())
+
+        snapshots = b"".join(snapshots)
+
+        # Writing to a temporary file first, so that an index file is never
+        # seen half written
+        with open(self.url + ".tmp", "wb") as file:
+            file.write(
+                header.pack(
+                    magic,
+                    version,
+                    self.match_id,
+                    self.start,
+                    self.rounds,
+                    self.interval,
+                )
+            )
+            file.write(snapshots)
+
+        replace(self.url + ".tmp", self.url)
+
+        return snapshots
+
+    def seek(self, round_number: int) -> MatchState:
+        """
+        This method returns the state of the match right after the given
+        round, where round 0 is the state before the first round.
+        """
+
+        assert 0 <= round_number <= self.rounds, f"Invalid Round [{round_number=}]"
+
+        snapshot = round_number // self.interval
+        state = MatchState.from_bytes(
+            self.snapshots, snapshot * MatchState.record_size
+        )
+        state.number_of_rounds = self.number_of_rounds
+
+        if state.round_number < round_number:
+            outcomes = self.reader.outcomes(
+                self.start + state.round_number, self.start + round_number
+            )
+            record = self.reader[self.start + round_number - 1]
+
+            state.first_score += outcomes.count(1)
+            state.second_score += outcomes.count(2)
+            state.round_number = round_number
+            state.first_move = Moves(record.first_move)
+            state.second_move = Moves(record.second_move)
+
+        if state.number_of_rounds is not None:
+            if state.first_score == state.number_of_rounds:
+                state.winner = 1
+            elif state.second_score == state.number_of_rounds:
+                state.winner = 2
+
+        return state
+
+    def close(self):
+        """
+        This method is used to unmap the log.
+        """
+
+        self.reader.close()
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+
+"""
+This module contains the seedable source of random moves used by the match
+engine and the strategies.
+"""
+
+from random import Random
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class MoveSource(Random):
+    """
+    Seedable random number generator which hands out random moves one at a
+    time from blocks of `block_size` moves drawn at once.
+
+    A source is identified by its `seed` and its `stream`, a tuple of non
+    negative integers. Sources with the same seed and different streams
+    produce independent sequences (they are spawned from the same NumPy
+    SeedSequence), hence parallel workers can be given their own stream of
+    one common seed and the whole simulation stays reproducible.
+
+    The moves are handed out by `next_move`, and apart from the moves every
+    source is a regular `random.Random` seeded from the same seed and
+    stream, which is used for everything else.
+    """
+
+    moves = (Moves.ROCK, Moves.PAPER, Moves.SCISSOR)
+
+    def __init__(
+        self, seed: int = None, stream: tuple = (), block_size: int = 4096
+    ):
+        assert block_size > 0, f"Invalid Block Size [{block_size=}]"
+
+        self.stream = tuple(stream)
+        self.block_size = block_size
+
+        # NumPy is used for drawing the blocks of moves when it is available,
+        # it is imported by the first source rather than along with this
+        # module, which keeps it off the startup of the game
+        try:
+            from numpy import uint32
+            from numpy.random import Generator, PCG64, SeedSequence
+        except ImportError:
+            SeedSequence = None
+
+        if SeedSequence is not None:
+            sequence = SeedSequence(seed, spawn_key=self.stream)
+            self.seed_value = sequence.entropy
+            self.generator = Generator(PCG64(sequence))
+            state = sequence.generate_state(4, uint32).tobytes()
+            super().__init__(int.from_bytes(state, "little"))
+        else:
+            self.seed_value = Random().getrandbits(128) if seed is None else seed
+            self.generator = None
+            super().__init__(f"{self.seed_value}/{self.stream}")
+
+        self.next_move = self.__moves__().__next__
+
+    def __block__(self) -> bytes:
+        """
+        This method draws a block of move indices.
+        """
+
+        if self.generator is not None:
+            return self.generator.integers(0, 3, self.block_size, "uint8").tobytes()
+
+        return bytes(self.choices((0, 1, 2), k=self.block_size))
+
+    def __moves__(self):
+        moves = self.moves
+
+        while True:
+            yield from map(moves.__getitem__, self.__block__())
+
+    def substream(self, *key: int):
+        """
+        This method returns a new source with the same seed whose stream is
+        extended by the given key, e.g. the index of a worker or a match.
+        """
+
+        return MoveSource(self.seed_value, self.stream + key, self.block_size)
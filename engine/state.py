@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+
+"""
+This module contains the compact state of a single match of the Rock, Paper
+and Scissors game.
+"""
+
+from struct import Struct
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class MatchState:
+    """
+    This class holds the scores, the last moves, the round counter, the
+    target number of rounds and the winner of a match.
+
+    The attributes are stored in slots rather than in a per instance
+    dictionary, and every state can be serialized to a fixed-size record
+    of `MatchState.record_size` bytes.
+    """
+
+    __slots__ = (
+        "first_score",
+        "second_score",
+        "round_number",
+        "number_of_rounds",
+        "first_move",
+        "second_move",
+        "winner",
+    )
+
+    # Scores, round counter and target rounds as unsigned 32 bit integers
+    # followed by both the moves and the winner as bytes, where 0 stands
+    # for a missing move or winner.
+    record = Struct("<IIIIBBBx")
+    record_size = record.size
+
+    def __init__(self, number_of_rounds: int = None):
+        self.number_of_rounds = number_of_rounds
+        self.reset()
+
+    def reset(self):
+        """
+        This method is used to reset everything but the target number of
+        rounds, so that a new match can be played.
+        """
+
+        self.first_score = 0
+        self.second_score = 0
+        self.round_number = 0
+        self.first_move = None
+        self.second_move = None
+        self.winner = None
+
+    def to_bytes(self) -> bytes:
+        """
+        This method is used to serialize the state to a fixed-size record.
+        """
+
+        return self.record.pack(
+            self.first_score,
+            self.second_score,
+            self.round_number,
+            self.number_of_rounds or 0,
+            self.first_move or 0,
+            self.second_move or 0,
+            self.winner or 0,
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0):
+        """
+        This method is used to deserialize a state from a record, which
+        starts at the given offset of the data.
+        """
+
+        (
+            first_score,
+            second_score,
+            round_number,
+            number_of_rounds,
+            first_move,
+            second_move,
+            winner,
+        ) = cls.record.unpack_from(data, offset)
+
+        state = cls(number_of_rounds or None)
+        state.first_score = first_score
+        state.second_score = second_score
+        state.round_number = round_number
+        state.first_move = Moves(first_move) if first_move else None
+        state.second_move = Moves(second_move) if second_move else None
+        state.winner = winner or None
+
+        return state
+
+    def __eq__(self, other):
+        if not isinstance(other, MatchState):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"MatchState({fields})"
@@ -21,3 +21,17 @@ def remove_field(*fields):
     for field in fields:
         if "destroy" in dir(field):
             field.destroy()
+
+
+def hide_field(*fields):
+    """
+    This function is used to hide all the fields passed into the
+    function, from the current screen, without destroying them so
+    that they can be placed again later on.
+
+    NOTE : Only the fields placed using the place geometry manager
+           can be hidden using this function.
+    """
+
+    for field in fields:
+        field.place_forget()
@@ -20,7 +20,7 @@ def on_click(instance_of_main_class):
     """
 
     def actions(*events):
-        instance_of_main_class.number_of_rounds = None
+        instance_of_main_class.game_engine.state.number_of_rounds = None
 
         remove_field(
             instance_of_main_class.number_of_rounds_label,
@@ -5,13 +5,7 @@ This module contains the events to be carried out when the SUBMIT button is
 being pressed.
 """
 
-from tkinter import messagebox, StringVar
-from sys import stderr
-
-try:
-    from events.layer1.__utils__ import remove_field
-except ImportError as e:
-    print(e, file=stderr)
+from tkinter import messagebox
 
 
 def on_click(instance_of_main_class):
@@ -21,11 +15,14 @@ def on_click(instance_of_main_class):
     Essentially this function checks the validity of the number, if the
     number is invalid then an appropriate error message is displayed
     prompting the user about the error. If everything is alright then
-    this function removes every components present in the screen and
-    then executes the next layer of the game play setup.
+    this function hides the starting screen and then executes the next
+    layer of the game play setup. When a match is replayed the number is
+    the round to be shown instead.
     """
 
     def actions(*events):
+        match_replay = instance_of_main_class.game_engine.match_replay
+
         try:
             rounds = int(instance_of_main_class.text_box.get(1.0, "end"))
         except ValueError:
@@ -39,15 +36,21 @@ def on_click(instance_of_main_class):
                     "Invalid Data", "Please enter a positive integer number."
                 )
                 instance_of_main_class.text_box.delete(1.0, "end")
-            else:
-                instance_of_main_class.game_engine.number_of_rounds = rounds
-                remove_field(
-                    instance_of_main_class.number_of_rounds_label,
-                    instance_of_main_class.text_box,
-                    instance_of_main_class.button_next,
-                    instance_of_main_class.button_back,
-                    instance_of_main_class.canvas,
+            elif match_replay is not None and rounds > match_replay.rounds:
+                messagebox.showerror(
+                    "Invalid Data",
+                    f"The match has only {match_replay.rounds} rounds.",
                 )
-                instance_of_main_class.load_playground_static_components()
+                instance_of_main_class.text_box.delete(1.0, "end")
+            elif match_replay is not None:
+                # The number is the round of the replayed match to be shown
+                instance_of_main_class.game_engine.state.number_of_rounds = (
+                    match_replay.number_of_rounds
+                )
+                instance_of_main_class.replay_round = rounds
+                instance_of_main_class.load_playground()
+            else:
+                instance_of_main_class.game_engine.state.number_of_rounds = rounds
+                instance_of_main_class.load_playground()
 
     return actions
@@ -4,8 +4,76 @@
 This module contains the utility functions.
 """
 
+from collections import OrderedDict
 from sys import stderr
 from PIL import Image, ImageTk
+from assets.resample import scale_image
+
+
+class ImageCache:
+    """
+    This class is a bounded LRU cache of the resized images, keyed by the
+    url of the image and its scaling factor. Only the PIL images are kept,
+    hence the same image can be handed to any number of widgets.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        assert maxsize > 0, f"Invalid Cache Size [{maxsize=}]"
+
+        self.maxsize = maxsize
+        self.images = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image_url: str, scaling_factor: float = 1):
+        """
+        This method returns the image at the url resized by the scaling
+        factor, which is decoded and resized only if it is not cached yet.
+        The least recently used image is evicted once the cache is full.
+
+        Exceptions raised while opening the image are propagated.
+        """
+
+        key = (image_url, scaling_factor)
+
+        if key in self.images:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return self.images[key]
+
+        self.misses += 1
+
+        with Image.open(image_url) as image:
+            image = scale_image(image, scaling_factor)
+
+        self.images[key] = image
+
+        if len(self.images) > self.maxsize:
+            self.images.popitem(last=False)
+
+        return image
+
+    def evict(self, image_url: str = None):
+        """
+        This method removes every cached size of the image at the url, or
+        every image when no url is given.
+        """
+
+        if image_url is None:
+            self.images.clear()
+        else:
+            for key in [key for key in self.images if key[0] == image_url]:
+                del self.images[key]
+
+    def stats(self) -> dict:
+        """
+        This method returns the number of hits, misses and cached images.
+        """
+
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.images)}
+
+
+image_cache = ImageCache()
 
 
 def resize_image(image_url: str, scaling_factor: float = 1):
@@ -17,15 +85,15 @@ def resize_image(image_url: str, scaling_factor: float = 1):
     This function returns the resized image as the output if
     the image is found at the url. In case any exception occurs
     then None will be returned.
+
+    The resized images are kept in `image_cache`, so every image is
+    decoded and resized only once for every scaling factor.
     """
 
     try:
-        image = Image.open(image_url)
+        image = image_cache.get(image_url, scaling_factor)
     except BaseException as e:
         print(e, file=stderr)
         return None
     else:
-        new_height = int(image.height * scaling_factor)
-        new_width = int(image.width * scaling_factor)
-        image = image.resize((new_width, new_height), Image.ANTIALIAS)
         return ImageTk.PhotoImage(image)
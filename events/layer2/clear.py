@@ -17,7 +17,7 @@ def on_click_left_button(instance_of_main_class):
         instance_of_main_class.left_radio_button_paper.deselect()
         instance_of_main_class.left_radio_button_scissor.deselect()
 
-        instance_of_main_class.game_engine.player[1]["choice"].set(0)
+        instance_of_main_class.player_1_choice.set(0)
 
     return actions
 
@@ -33,6 +33,6 @@ def on_click_right_button(instance_of_main_class):
         instance_of_main_class.right_radio_button_paper.deselect()
         instance_of_main_class.right_radio_button_scissor.deselect()
 
-        instance_of_main_class.game_engine.player[1]["choice"].set(0)
+        instance_of_main_class.player_1_choice.set(0)
 
     return actions
@@ -0,0 +1,31 @@
+#!/usr/bin/python3
+
+"""
+This module contains the events to be carried out when the keys moving
+through the rounds of a replayed match are being pressed.
+"""
+
+
+def on_key(instance_of_main_class, step: int):
+    """
+    Actions which will take place when a key moving through the rounds of
+    a replayed match is pressed, i.e. the round which is `step` rounds
+    away from the round shown is shown instead.
+    """
+
+    def actions(*events):
+        instance_of_main_class.seek_round(step)
+
+    return actions
+
+
+def on_escape(instance_of_main_class):
+    """
+    Actions which will take place when the escape key is pressed while a
+    match is replayed, i.e. the prompt of the round is shown again.
+    """
+
+    def actions(*events):
+        instance_of_main_class.leave_replay()
+
+    return actions
@@ -0,0 +1,19 @@
+#!/usr/bin/python3
+
+"""
+This module contains the events to be carried out when the SIMULATE button
+is being pressed.
+"""
+
+
+def on_click(instance_of_main_class):
+    """
+    Actions which will take place when the SIMULATE button on the side of
+    the user is clicked, i.e. all the remaining rounds of the match are
+    played at once.
+    """
+
+    def actions(*events):
+        instance_of_main_class.simulate()
+
+    return actions
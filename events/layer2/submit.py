@@ -5,13 +5,12 @@ This module contains the events to be carried out when the SUBMIT button is
 being pressed.
 """
 
-from tkinter import messagebox, Label
+from tkinter import messagebox
 from sys import stderr
 
 try:
-    from events.layer2.__utils__ import resize_image
-    from events.layer1.__utils__ import remove_field
     from constants.moves import Moves
+    from constants.phases import Phase
 except ImportError as e:
     print(e, file=stderr)
 
@@ -23,52 +22,39 @@ def on_click_left_button(instance_of_main_class):
     """
 
     def actions(*events):
-        result = instance_of_main_class.game_engine.player[1]["choice"].get()
+        # The move can not be submitted again while the round is in progress
+        if instance_of_main_class.phase != Phase.IDLE:
+            return
+
+        result = instance_of_main_class.player_1_choice.get()
 
         assert result in (0, 1, 2, 4), "Invalid Move"
 
         if result == 1:
-            choice = resize_image(
-                instance_of_main_class.image_url[Moves.ROCK],
-                instance_of_main_class.scaling_factor * 2,
+            choice = instance_of_main_class.move_image(
+                Moves.ROCK, instance_of_main_class.scaling_factor * 2
             )
-            instance_of_main_class.game_engine.player[1]["move"] = Moves.ROCK
+            instance_of_main_class.game_engine.state.first_move = Moves.ROCK
         elif result == 2:
-            choice = resize_image(
-                instance_of_main_class.image_url[Moves.PAPER],
-                instance_of_main_class.scaling_factor * 2,
+            choice = instance_of_main_class.move_image(
+                Moves.PAPER, instance_of_main_class.scaling_factor * 2
             )
-            instance_of_main_class.game_engine.player[1]["move"] = Moves.PAPER
+            instance_of_main_class.game_engine.state.first_move = Moves.PAPER
         elif result == 4:
-            choice = resize_image(
-                instance_of_main_class.image_url[Moves.SCISSOR],
-                instance_of_main_class.scaling_factor * 2,
+            choice = instance_of_main_class.move_image(
+                Moves.SCISSOR, instance_of_main_class.scaling_factor * 2
             )
-            instance_of_main_class.game_engine.player[1]["move"] = Moves.SCISSOR
+            instance_of_main_class.game_engine.state.first_move = Moves.SCISSOR
         else:
             messagebox.showerror("Invalid move", "Please choose a valid move")
-            instance_of_main_class.game_engine.player[1]["choice"].set(0)
+            instance_of_main_class.player_1_choice.set(0)
             return
 
-        remove_field(
-            instance_of_main_class.left_choice_rock,
-            instance_of_main_class.left_choice_paper,
-            instance_of_main_class.left_choice_scissor,
-            instance_of_main_class.left_radio_button_rock,
-            instance_of_main_class.left_radio_button_paper,
-            instance_of_main_class.left_radio_button_scissor,
-            instance_of_main_class.left_button_submit_choice,
-            instance_of_main_class.left_button_clear_choice,
-        )
-
-        instance_of_main_class.player_1_move = Label(
-            instance_of_main_class.root, image=choice, borderwidth=0
-        )
-        instance_of_main_class.player_1_move.image = choice
-        instance_of_main_class.player_1_move.place(x=120, y=100)
+        instance_of_main_class.hide_choices("left")
+        instance_of_main_class.show_move(player=1, image=choice)
 
         instance_of_main_class.place_next_move()
-        instance_of_main_class.game_engine.evaluate()
+        instance_of_main_class.reveal()
 
     return actions
 
@@ -80,52 +66,38 @@ def on_click_right_button(instance_of_main_class):
     """
 
     def actions(*events):
-        result = instance_of_main_class.game_engine.player[1]["choice"].get()
+        # The move can not be submitted again while the round is in progress
+        if instance_of_main_class.phase != Phase.IDLE:
+            return
+
+        result = instance_of_main_class.player_1_choice.get()
 
         assert result in (0, 1, 2, 4), "Invalid Move"
 
         if result == 1:
-            choice = resize_image(
-                instance_of_main_class.image_url[Moves.ROCK],
-                instance_of_main_class.scaling_factor * 2,
+            choice = instance_of_main_class.move_image(
+                Moves.ROCK, instance_of_main_class.scaling_factor * 2
             )
-            instance_of_main_class.game_engine.player[1]["move"] = Moves.ROCK
+            instance_of_main_class.game_engine.state.first_move = Moves.ROCK
         elif result == 2:
-            choice = resize_image(
-                instance_of_main_class.image_url[Moves.PAPER],
-                instance_of_main_class.scaling_factor * 2,
+            choice = instance_of_main_class.move_image(
+                Moves.PAPER, instance_of_main_class.scaling_factor * 2
             )
-            instance_of_main_class.game_engine.player[1]["move"] = Moves.PAPER
+            instance_of_main_class.game_engine.state.first_move = Moves.PAPER
         elif result == 4:
-            choice = resize_image(
-                instance_of_main_class.image_url[Moves.SCISSOR],
-                instance_of_main_class.scaling_factor * 2,
+            choice = instance_of_main_class.move_image(
+                Moves.SCISSOR, instance_of_main_class.scaling_factor * 2
             )
-            instance_of_main_class.game_engine.player[1]["move"] = Moves.SCISSOR
+            instance_of_main_class.game_engine.state.first_move = Moves.SCISSOR
         else:
             messagebox.showerror("Invalid move", "Please choose a valid move")
-            instance_of_main_class.game_engine.player[1]["choice"].set(0)
+            instance_of_main_class.player_1_choice.set(0)
             return
 
-        remove_field(
-            instance_of_main_class.right_choice_rock,
-            instance_of_main_class.right_choice_paper,
-            instance_of_main_class.right_choice_scissor,
-            instance_of_main_class.right_radio_button_rock,
-            instance_of_main_class.right_radio_button_paper,
-            instance_of_main_class.right_radio_button_scissor,
-            instance_of_main_class.right_button_submit_choice,
-            instance_of_main_class.right_button_clear_choice,
-        )
-
-        instance_of_main_class.player_1_move = Label(
-            instance_of_main_class.root, image=choice, borderwidth=0
-        )
-        instance_of_main_class.player_1_move.image = choice
-        coordinates = {"x": instance_of_main_class.width // 2 + 120, "y": 100}
-        instance_of_main_class.player_1_move.place(**coordinates)
+        instance_of_main_class.hide_choices("right")
+        instance_of_main_class.show_move(player=1, image=choice)
 
         instance_of_main_class.place_next_move()
-        instance_of_main_class.game_engine.evaluate()
+        instance_of_main_class.reveal()
 
     return actions
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+
+"""
+This module contains the instrumentation of the stalls of the tkinter event
+loop, i.e. the time for which the event loop was not able to run any
+callback because another callback was still running.
+"""
+
+from sys import stderr
+from time import perf_counter
+
+
+class StallMonitor:
+    """
+    This class measures the stalls of the event loop during every round. A
+    heartbeat is scheduled every `interval` milliseconds while a round is in
+    progress, and the delay with which each heartbeat runs after its due
+    time is accounted as stall time of the round.
+
+    The stalls of every round are kept in `rounds` as tuples of the round
+    number, the longest and the total stall time in milliseconds, and are
+    also printed to `file` unless it is None.
+    """
+
+    def __init__(self, root, interval: int = 10, file=stderr):
+        assert interval > 0, f"Invalid Interval [{interval=}]"
+
+        self.root = root
+        self.interval = interval
+        self.file = file
+        self.rounds = list()
+        self.job = None
+        self.due = None
+        self.longest = 0.0
+        self.total = 0.0
+
+    def __tick__(self):
+        """
+        This method is the heartbeat of the monitor.
+        """
+
+        now = perf_counter()
+        self.__account__(now)
+
+        self.due = now + self.interval / 1000
+        self.job = self.root.after(self.interval, self.__tick__)
+
+    def begin_round(self):
+        """
+        This method is used to start measuring the stalls of a new round.
+        """
+
+        self.end_round()
+
+        self.longest = 0.0
+        self.total = 0.0
+        self.due = perf_counter() + self.interval / 1000
+        self.job = self.root.after(self.interval, self.__tick__)
+
+    def end_round(self, round_number: int = None):
+        """
+        This method is used to stop measuring the stalls of the current
+        round, and to record them if the number of the round is given.
+        """
+
+        if self.job is None:
+            return
+
+        self.root.after_cancel(self.job)
+        self.job = None
+
+        # The heartbeat which is still pending might be overdue as well
+        self.__account__(perf_counter())
+
+        if round_number is None:
+            return
+
+        self.rounds.append((round_number, self.longest, self.total))
+
+        if self.file is not None:
+            print(
+                f"Round {round_number} : longest stall {self.longest:.1f} ms, "
+                f"total stall {self.total:.1f} ms",
+                file=self.file,
+            )
+
+    def __account__(self, now: float):
+        """
+        This method accounts the delay of the pending heartbeat, if any.
+        """
+
+        stall = max(0.0, (now - self.due) * 1000)
+
+        self.longest = max(self.longest, stall)
+        self.total += stall
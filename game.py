@@ -4,11 +4,27 @@
 Rock, Paper and Scissors Game implementation.
 """
 
-from time import sleep
-from gui import GUI
-from random import randint
+from time import perf_counter
+from contextlib import contextmanager
+
+# The time at which the game started loading, i.e. before all the imports
+started = perf_counter()
+
+from sys import stderr
+from renderers.__renderers__ import renderers
 from constants.moves import Moves
-from constants.colors_table import color
+from engine.match import MatchEngine
+from engine.rng import MoveSource
+from constants.constants import reveal_delay, odds_limit, fast_forward_factor
+from engine.odds import win_probability
+from engine.log import MatchLog
+from engine.replay import MatchReplay
+from engine.state import MatchState
+from assets.resample import policies, set_policy
+from strategies.__strategies__ import strategies, create_strategy
+from strategies.basic import ConstantStrategy, MixStrategy
+
+imported = perf_counter()
 
 
 class RockPaperScissorsGame:
@@ -16,17 +32,96 @@ class RockPaperScissorsGame:
     Game Engine of Rock, Paper and Scissors game.
     """
 
-    def __init__(self):
-        self.player = {1: dict(), 2: dict()}
-        self.player[1]["score"] = 0
-        self.player[2]["score"] = 0
-        self.player[1]["choice"] = None
-        self.player[2]["choice"] = None
-        self.player[1]["move"] = None
-        self.player[2]["move"] = None
-        self.number_of_rounds = None
-        self.winner = None
-        self.computer_side = "right" if randint(0, 1) else "left"
+    def __init__(
+        self,
+        strategy: str = "random",
+        seed: int = None,
+        reveal_delay: int = reveal_delay,
+        report_stalls: bool = False,
+        renderer: str = "widgets",
+        autoplay: str = None,
+        fast_forward_policy: str = "repeat",
+        mix: tuple = (1, 1, 1),
+        odds: tuple = None,
+        log: str = None,
+        replay: str = None,
+        match_id: int = None,
+        deferred: bool = False,
+    ):
+        assert renderer in renderers, f"Unknown Renderer [{renderer=}]"
+        assert autoplay is None or autoplay in strategies, "Unknown Strategy"
+        assert (
+            fast_forward_policy == "repeat" or fast_forward_policy in strategies
+        ), f"Unknown Policy [{fast_forward_policy=}]"
+
+        self.strategy_name = strategy
+        self.reveal_delay = reveal_delay
+        self.report_stalls = report_stalls
+        self.renderer = renderer
+        self.autoplay = autoplay
+        self.fast_forward_policy = fast_forward_policy
+        self.mix = tuple(mix)
+        self.odds = None if odds is None else tuple(odds)
+        self.engine = MatchEngine()
+        self.state = self.engine.state
+
+        # Every round is appended to the log of rounds in the given directory
+        self.log = None if log is None else MatchLog(log)
+        if self.log is not None:
+            self.engine.subscribe(self.log)
+
+        # The match of the log of rounds in the given directory being replayed
+        self.match_replay = None if replay is None else MatchReplay(replay, match_id)
+
+        # A deferred first match is set up once the first frame of the gui
+        # has been drawn, along with NumPy which seeds the sources of moves
+        self.seed = seed
+        self.source = None
+
+        if not deferred:
+            self.new_match(seed)
+
+    def new_match(self, seed: int = None):
+        """
+        This method is used to set up a new match with its own seed, the
+        side of the computer and its strategy are chosen again. The scores
+        are cleared on the same match engine, hence its subscribers, such
+        as the gui, are kept.
+        """
+
+        self.source = MoveSource(seed)
+        self.computer_side = "right" if self.source.getrandbits(1) else "left"
+        self.strategy = create_strategy(
+            self.strategy_name, self.source.seed_value, (1,)
+        )
+        # The strategy playing instead of the user in an automatic match
+        self.autoplayer = (
+            None
+            if self.autoplay is None
+            else create_strategy(self.autoplay, self.source.seed_value, (3,))
+        )
+        self.engine.source = self.source.substream(2)
+        self.engine.reset()
+
+        if self.log is not None:
+            self.log.begin_match()
+
+    def prepare(self):
+        """
+        This method is used to set up the first match, unless it has
+        already been set up.
+        """
+
+        if self.source is None:
+            self.new_match(self.seed)
+
+    def reset(self):
+        """
+        This method is used to set up the next match, which is seeded by the
+        current match so that a seeded game replays the same way.
+        """
+
+        self.new_match(self.source.getrandbits(64))
 
     def __check__(self, action: dict) -> int:
         """
@@ -48,123 +143,308 @@ class RockPaperScissorsGame:
         is missing from the dictonary action)
         """
 
-        if "first_player" not in action:
-            return -1
-
-        if "second_player" not in action:
-            return -2
-
-        result = action["second_player"] - action["first_player"]
-
-        return 0 if not result else 1 if result in {3, -1, -2} else 2
+        return MatchEngine.check(
+            action.get("first_player"), action.get("second_player")
+        )
 
     def evaluate(self):
         """
         This method evaluates the moves from both players and decides the
-        winner.
+        winner. It is called by the gui once the moves of both the players
+        have been revealed.
         """
 
-        self.gui.update_root()
+        self.strategy.observe(self.state.first_move)
+        self.engine.play_round(self.state.first_move, self.state.second_move)
 
-        sleep(1.5)
+    def player_names(self) -> tuple:
+        """
+        This method returns the names of the first and the second player.
+        """
 
-        winner = self.__check__(
-            {
-                "first_player": self.player[1]["move"],
-                "second_player": self.player[2]["move"],
-            }
-        )
+        if self.autoplayer is None:
+            return "You", "Computer"
 
-        assert winner in (0, 1, 2), f"Invalid Move [{winner=}]"
-        assert self.computer_side in (
-            "left",
-            "right",
-        ), f"Invalid Side [{self.computer_side=}]"
-
-        it_is_a_tie = winner == 0
-
-        if it_is_a_tie:
-            text = "It's a tie"
-            fg = color["lemon_yellow"]
-        elif winner == 1:
-            self.player[1]["score"] += 1
-            fg = (
-                color["sky_blue"]
-                if self.computer_side == "right"
-                else color["lime_green"]
+        return self.autoplay.capitalize(), self.strategy_name.capitalize()
+
+    def play_rounds(self, rounds: int) -> int:
+        """
+        This method plays up to the given number of rounds of an automatic
+        match at full speed, i.e. without notifying the subscribers of the
+        engine about every round. It returns the winner of the match, or
+        None if the match is not over yet.
+        """
+
+        assert self.autoplayer is not None, "Not An Automatic Match"
+
+        with self.__logging__() as notify:
+            return self.engine.play_match(
+                self.autoplayer,
+                self.strategy,
+                self.state.round_number + rounds,
+                notify=notify,
             )
+
+    def fast_forward(self, selected_move: Moves = None) -> int:
+        """
+        This method plays all the remaining rounds of the match at once and
+        returns the winner. The moves of the user are played according to
+        the fast forward policy, which is either "repeat", i.e. the last move
+        of the user (or the selected move if no round has been played yet)
+        is repeated, or the name of a strategy, where the "mix" strategy
+        plays with the weights of `mix`.
+
+        The match is stopped without a winner, and None is returned, after
+        `fast_forward_factor` times the number of rounds of the match, e.g.
+        when the user repeats the move always played by the computer.
+        """
+
+        source = self.source.substream(4)
+
+        if self.fast_forward_policy == "repeat":
+            move = self.state.first_move or selected_move or Moves.ROCK
+            player = ConstantStrategy(source, move)
+        elif self.fast_forward_policy == MixStrategy.name:
+            player = MixStrategy(source, self.mix)
         else:
-            self.player[2]["score"] += 1
-            fg = (
-                color["lime_green"]
-                if self.computer_side == "right"
-                else color["sky_blue"]
+            player = create_strategy(
+                self.fast_forward_policy, self.source.seed_value, (4,)
             )
 
-        sum_of_moves = self.player[1]["move"] + self.player[2]["move"]
-
-        assert it_is_a_tie or sum_of_moves in (
-            3,
-            5,
-            6,
-        ), f"Invalid Move [{it_is_a_tie=}, {result=}]"
-
-        if sum_of_moves == 3:
-            text = "Paper covers Rock"
-        elif sum_of_moves == 5:
-            text = "Rock crushes Scissor"
-        elif sum_of_moves == 6:
-            text = "Scissor cuts Paper"
-
-        self.gui.config_status_label(fg=fg)
-        self.gui.set_status(status=text)
-        self.gui.set_player_score(player=1, score=self.player[1]["score"])
-        self.gui.set_player_score(player=2, score=self.player[2]["score"])
-        self.gui.destroy_move(player=1)
-        self.gui.destroy_move(player=2)
-
-        self.player[1]["choice"].set(0)
-        self.player[2]["choice"].set(0)
-
-        if self.player[1]["score"] == self.number_of_rounds:
-            self.winner = 1
-            self.gui.ending_screen()
-        elif self.player[2]["score"] == self.number_of_rounds:
-            self.winner = 2
-            self.gui.ending_screen()
-        else:
-            self.gui.load_playground_dynamic_components()
+        max_rounds = (
+            self.state.round_number + fast_forward_factor * self.state.number_of_rounds
+        )
 
-    def generate_next_move(self) -> Moves:
+        with self.__logging__() as notify:
+            if notify:
+                return self.engine.play_match(player, self.strategy, max_rounds)
+
+            return self.engine.fast_forward(player, self.strategy, max_rounds)
+
+    @contextmanager
+    def __logging__(self):
         """
-        This method is used to generate random moves.
+        This method is used while rounds are played at full speed, i.e.
+        without notifying the gui. If there is a log of rounds, it is left as
+        the only subscriber of the engine and True is yielded, so that the
+        rounds are played one at a time and every round is still logged.
         """
 
-        result = 2 ** randint(0, 2)
+        if self.log is None:
+            yield False
+            return
 
-        if result == 1:
-            self.player[2]["move"] = Moves.ROCK
-        elif result == 2:
-            self.player[2]["move"] = Moves.PAPER
-        elif result == 4:
-            self.player[2]["move"] = Moves.SCISSOR
-        else:
-            self.player[2]["move"] = None
+        subscribers = self.engine.subscribers
+        self.engine.subscribers = [self.log]
+
+        try:
+            yield True
+        finally:
+            self.engine.subscribers = subscribers
+
+    def win_probability(self) -> float:
+        """
+        This method returns the exact probability that the user wins the
+        match from the current score, given the probabilities of winning,
+        tying and losing a round in `odds`. None is returned if the odds are
+        not known, or if the match is longer than `odds_limit` rounds.
+        """
+
+        if self.odds is None or self.state.number_of_rounds > odds_limit:
+            return None
 
-        return self.player[2]["move"]
+        win, _, loss = self.odds
+
+        return win_probability(
+            self.state.number_of_rounds,
+            win,
+            loss,
+            self.state.first_score,
+            self.state.second_score,
+        )
 
-    def play(self, replay: bool = False):
+    def seek(self, round_number: int):
+        """
+        This method is used to set the state of the match to the state of
+        the replayed match right after the given round.
+        """
+
+        assert self.match_replay is not None, "Not A Replayed Match"
+
+        state = self.match_replay.seek(round_number)
+
+        for name in MatchState.__slots__:
+            setattr(self.state, name, getattr(state, name))
+
+    def generate_next_move(self) -> Moves:
+        """
+        This method is used to generate the next move of the computer using
+        the selected strategy.
+        """
+
+        self.state.second_move = self.strategy.next_move()
+
+        return self.state.second_move
+
+    def play(self, started: float = None):
         """
         This function is used by the user in order to play the game.
         Calling this function will start and end the game securely
-        in an ordered way.
+        in an ordered way. Every replay is played on the same window.
+
+        If the time at which the game started loading is given, as returned
+        by `time.perf_counter`, then the time till the first frame is shown
+        is reported.
         """
 
-        if replay:
-            self.__init__()
-        self.gui = GUI(self)
+        self.gui = renderers[self.renderer](
+            self, self.reveal_delay, report_stalls=self.report_stalls, started=started
+        )
+        self.engine.subscribe(self.gui.on_round_result)
         self.gui.start()
 
+        if self.log is not None:
+            self.log.close()
+
 
 if __name__ == "__main__":
-    RockPaperScissorsGame().play()
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(description="Rock, Paper and Scissors Game")
+    parser.add_argument(
+        "--strategy",
+        choices=list(strategies),
+        default="random",
+        help="the strategy played by the computer",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="seed of the moves of the computer"
+    )
+    parser.add_argument(
+        "--resample",
+        choices=list(policies),
+        default="balanced",
+        help="the quality/speed policy of resizing the images",
+    )
+    parser.add_argument(
+        "--reveal-delay",
+        type=int,
+        default=reveal_delay,
+        help="milliseconds for which both the moves are shown before a round ends",
+    )
+    parser.add_argument(
+        "--report-stalls",
+        action="store_true",
+        help="print the stall time of the event loop of every round",
+    )
+    parser.add_argument(
+        "--autoplay",
+        choices=list(strategies),
+        default=None,
+        help="the strategy playing instead of the user, at full speed",
+    )
+    parser.add_argument(
+        "--fast-forward",
+        choices=["repeat", *strategies],
+        default="repeat",
+        help="the policy playing the remaining rounds of the user when they "
+        "are simulated, repeat plays the last move again",
+    )
+    parser.add_argument(
+        "--mix",
+        type=float,
+        nargs=3,
+        default=(1, 1, 1),
+        metavar=("ROCK", "PAPER", "SCISSOR"),
+        help="the weights of the moves of the mix policy",
+    )
+    parser.add_argument(
+        "--odds",
+        type=float,
+        nargs=3,
+        default=None,
+        metavar=("WIN", "TIE", "LOSS"),
+        help="show the odds of winning the match, given the probabilities of "
+        "winning, tying and losing a round, e.g. 1 1 1 against random moves",
+    )
+    parser.add_argument(
+        "--log",
+        default=None,
+        metavar="DIRECTORY",
+        help="append every round to the log of rounds in the directory",
+    )
+    parser.add_argument(
+        "--replay",
+        default=None,
+        metavar="DIRECTORY",
+        help="replay a match of the log of rounds in the directory, the arrow "
+        "keys move through its rounds",
+    )
+    parser.add_argument(
+        "--match",
+        type=int,
+        default=None,
+        help="the id of the replayed match, the last match of the log by default",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=list(renderers),
+        default="widgets",
+        help="the renderer of the playground",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print the time taken by the imports and till the first frame",
+    )
+    arguments = parser.parse_args()
+
+    if arguments.startup_report:
+        print(f"Imports took {(imported - started) * 1000:.1f} ms", file=stderr)
+
+    if arguments.reveal_delay < 0:
+        parser.error("the reveal delay can not be negative")
+
+    if min(arguments.mix) < 0 or sum(arguments.mix) <= 0:
+        parser.error("the weights of the mix policy are invalid")
+
+    if arguments.odds is not None and (
+        min(arguments.odds) < 0 or arguments.odds[0] + arguments.odds[2] <= 0
+    ):
+        parser.error("the probabilities of the odds are invalid")
+
+    if arguments.match is not None and arguments.replay is None:
+        parser.error("the match can only be given along with --replay")
+
+    if arguments.replay is not None:
+        from os.path import isdir
+        from engine.log import LogReader
+
+        if not isdir(arguments.replay):
+            parser.error(f"the log {arguments.replay} is not a directory")
+
+        with LogReader(arguments.replay) as reader:
+            if not len(reader):
+                parser.error(f"the log {arguments.replay} is empty")
+
+            if arguments.match is not None and not reader.match_rounds(
+                arguments.match
+            ):
+                parser.error(f"the match {arguments.match} is not in the log")
+
+    set_policy(arguments.resample)
+    RockPaperScissorsGame(
+        arguments.strategy,
+        arguments.seed,
+        arguments.reveal_delay,
+        arguments.report_stalls,
+        arguments.renderer,
+        arguments.autoplay,
+        arguments.fast_forward,
+        arguments.mix,
+        arguments.odds,
+        arguments.log,
+        arguments.replay,
+        arguments.match,
+        deferred=True,
+    ).play(started if arguments.startup_report else None)
@@ -3,11 +3,18 @@
 """
 This contains the GUI implementation of Rock, Paper and Scissors game
 using tkinter.
+
+Only the modules of the starting screen are imported along with this module,
+the modules of the ABOUT screen, the playground and the ending screen are
+imported once those screens are shown for the first time.
 """
 
-from time import sleep
+from sys import stderr
+from time import perf_counter
 from constants.moves import Moves
+from constants.phases import Phase
 from constants.colors_table import color
+from constants.outcomes import outcome_table, outcome_index
 from constants.constants import (
     width,
     height,
@@ -21,14 +28,27 @@ from constants.constants import (
     scissor_unicode,
     scissor_image_url,
     scaling_factor,
+    atlas_image_url,
+    atlas_index_url,
+    pixel_cache_url,
+    display_scaling_factors,
+    preload_interval,
+    autoplay_fps,
+    required_assets,
+    reveal_delay,
+    ending_delay,
+    stall_interval,
     background_image_url,
     background_image_scaling_factor,
     canvas_text_x,
     canvas_text_y,
     __project_name__,
 )
-from events.layer1.__utils__ import remove_field
+from events.layer1.__utils__ import remove_field, hide_field
 from events.layer2.__utils__ import resize_image
+from events.stall import StallMonitor
+from assets.validation import validate_assets
+from assets.preload import Preloader, load_sprite_images
 from effects.layer1 import (
     about as effects_about,
     play as effects_play,
@@ -37,17 +57,11 @@ from effects.layer1 import (
     exit as effects_exit,
 )
 from events.layer1 import (
-    about as events_about,
     play as events_play,
     submit as events_next,
     back as events_back,
     exit as events_exit,
 )
-from effects.layer2 import (
-    clear as effects_clear_choice,
-    submit as effects_submit_choice,
-)
-from events.layer2 import clear as events_clear_choice, submit as events_submit_choice
 from tkinter import (
     Tk,
     Canvas,
@@ -60,9 +74,9 @@ from tkinter import (
     RAISED,
     Text,
     Frame,
-    messagebox,
     IntVar,
     Radiobutton,
+    Misc,
 )
 
 
@@ -71,7 +85,17 @@ class GUI:
     This class contains the gui components and their implementation.
     """
 
-    def __init__(self, game_engine):
+    def __init__(
+        self,
+        game_engine,
+        reveal_delay: int = reveal_delay,
+        ending_delay: int = ending_delay,
+        report_stalls: bool = False,
+        started: float = None,
+    ):
+        assert reveal_delay >= 0, f"Invalid Delay [{reveal_delay=}]"
+        assert ending_delay >= 0, f"Invalid Delay [{ending_delay=}]"
+
         self.unicode = {
             Moves.ROCK: rock_unicode,
             Moves.PAPER: paper_unicode,
@@ -90,8 +114,89 @@ class GUI:
         self.font_size = font_size
         self.common_formatting_options = common_formatting_options
         self.scaling_factor = scaling_factor
+        self.sprites = dict()
+        self.preloader = None
+        self.autoplay_batch = 1
+        self.replay_round = 1
+        self.phase = Phase.IDLE
+        self.playground_loaded = False
+        self.playground_places = list()
+        self.reveal_delay = reveal_delay
+        self.ending_delay = ending_delay
+        self.report_stalls = report_stalls
+        self.stall_monitor = None
+        self.started = started
         self.game_engine = game_engine
 
+    def preload_sprites(self):
+        """
+        This method starts decoding and resizing the images of all the moves
+        at all the displayed sizes in the background, they are handed over
+        to the sprites by `poll_sprites`. It has to be called after the root
+        window is created.
+        """
+
+        if self.preloader is not None:
+            return
+
+        self.preloader = Preloader(
+            load_sprite_images,
+            list(self.image_url.values()),
+            display_scaling_factors,
+            pixel_cache_url,
+            atlas_image_url,
+            atlas_index_url,
+        )
+        self.preloader.start()
+
+        self.root.after(preload_interval, self.poll_sprites)
+
+    def poll_sprites(self):
+        """
+        This method adds the images which have been preloaded so far to the
+        sprites, and polls again until the preloading is done.
+        """
+
+        self.add_sprites(self.preloader.poll())
+
+        if not self.preloader.done:
+            self.root.after(preload_interval, self.poll_sprites)
+
+    def add_sprites(self, images: list):
+        """
+        This method converts the preloaded images, a list of pairs of a key
+        and a PIL image, to tkinter images and adds them to the sprites.
+        """
+
+        from PIL import ImageTk
+
+        for key, image in images:
+            self.sprites[key] = ImageTk.PhotoImage(image)
+
+    def load_sprites(self):
+        """
+        This method is used to load the images of all the moves at all the
+        displayed sizes, waiting for the images which are still being
+        preloaded in the background.
+        """
+
+        self.preload_sprites()
+        self.add_sprites(self.preloader.wait())
+
+    def move_image(self, move: Moves, scaling_factor: float):
+        """
+        This method returns the image of the move scaled by the scaling
+        factor. The image is taken from the sprite atlas, if the atlas does
+        not contain it then it is resized from the original image once.
+        """
+
+        key = (self.image_url[move], scaling_factor)
+
+        if key not in self.sprites:
+            self.sprites[key] = resize_image(*key)
+
+        return self.sprites[key]
+
     def update_root(self):
         """
         This method is used to update the current tkinter window.
@@ -125,17 +230,306 @@ class GUI:
         else:
             self.player_2_score.set(str(score))
 
-    def destroy_move(self, player: int):
+    def reveal(self):
         """
-        This method is used to destroy the move of the current player.
+        This method starts the reveal of the moves of both the players which
+        have just been placed. The round is evaluated by `advance` once the
+        reveal delay is over, meanwhile the event loop keeps running.
+
+        This method returns False, without doing anything, if a round is
+        already in progress, e.g. when the move is submitted twice.
+        """
+
+        if self.phase != Phase.IDLE:
+            return False
+
+        self.phase = Phase.REVEAL
+
+        if self.stall_monitor is not None:
+            self.stall_monitor.begin_round()
+
+        self.root.after(self.reveal_delay, self.advance)
+
+        return True
+
+    def advance(self):
+        """
+        This method advances the round to its next phase, it is scheduled
+        using the `after` method of the root window.
+
+        REVEAL -> EVALUATE : the round is played, after that the result of
+                             the round is displayed by `on_round_result`,
+                             which moves on to either IDLE or ENDING.
+        ENDING             : the ending screen is displayed.
+        """
+
+        if self.phase == Phase.REVEAL:
+            self.phase = Phase.EVALUATE
+            self.game_engine.evaluate()
+        elif self.phase == Phase.ENDING:
+            self.ending_screen()
+
+    def autoplay(self):
+        """
+        This method plays the rounds of an automatic match for a single frame
+        at full speed, then draws the latest moves and scores and schedules
+        the next frame. The rounds in between the frames are never drawn,
+        hence at most `autoplay_fps` frames are drawn per second however
+        fast the strategies are.
+        """
+
+        frame = 1 / autoplay_fps
+
+        start = perf_counter()
+        winner = self.game_engine.play_rounds(self.autoplay_batch)
+        elapsed = perf_counter() - start
+
+        # The rounds of a frame take about half of the time of the frame,
+        # leaving the other half to tkinter
+        if elapsed < frame / 4:
+            self.autoplay_batch *= 2
+        elif elapsed > frame / 2 and self.autoplay_batch > 1:
+            self.autoplay_batch //= 2
+
+        self.show_state()
+
+        if winner is None:
+            delay = max(1, int((frame - (perf_counter() - start)) * 1000))
+            self.root.after(delay, self.autoplay)
+        else:
+            self.phase = Phase.ENDING
+            self.root.after(self.ending_delay, self.advance)
+
+    def simulate(self):
+        """
+        This method plays all the remaining rounds of the match at once,
+        with the moves of the user played according to the fast forward
+        policy of the game engine, and then shows the final scores and the
+        ending screen. If the simulated rounds do not lead to a winner, e.g.
+        because both the players keep playing the same move, the rounds
+        played are shown and the user carries on playing the match.
+        """
+
+        if self.phase != Phase.IDLE:
+            return
+
+        self.phase = Phase.EVALUATE
+        self.hide_choices("left")
+        self.hide_choices("right")
+
+        selected_move = self.player_1_choice.get()
+        winner = self.game_engine.fast_forward(
+            Moves(selected_move) if selected_move else None
+        )
+
+        self.show_state()
+
+        if winner is None:
+            self.set_status(
+                status=f"Round {self.game_engine.state.round_number} : No winner yet"
+            )
+            self.hide_move(player=1)
+            self.hide_move(player=2)
+            self.load_playground_dynamic_components()
+            self.phase = Phase.IDLE
+            return
+
+        self.phase = Phase.ENDING
+        self.root.after(self.ending_delay, self.advance)
+
+    def seek_round(self, step: int):
+        """
+        This method shows the round of the replayed match which is `step`
+        rounds away from the round shown, within the first and the last
+        round of the match.
+        """
+
+        if self.phase != Phase.EVALUATE:
+            return
+
+        match_replay = self.game_engine.match_replay
+        self.show_round(min(max(1, self.replay_round + step), match_replay.rounds))
+
+    def leave_replay(self):
+        """
+        This method goes back from the replayed match to the prompt of the
+        round to be shown.
+        """
+
+        if self.phase != Phase.EVALUATE:
+            return
+
+        self.replay()
+
+    def show_round(self, round_number: int):
+        """
+        This method shows the state of the replayed match right after the
+        given round, i.e. the moves of the round and the scores.
+        """
+
+        self.replay_round = round_number
+        self.game_engine.seek(round_number)
+        self.show_state()
+
+    def show_state(self):
+        """
+        This method draws the last round played along with the scores of
+        both the players.
+        """
+
+        state = self.game_engine.state
+
+        _, text, fg = outcome_table[self.game_engine.computer_side][
+            outcome_index(state.first_move, state.second_move)
+        ]
+
+        self.config_status_label(fg=fg)
+        self.set_status(status=f"Round {state.round_number} : {text}")
+        self.set_player_score(player=1, score=state.first_score)
+        self.set_player_score(player=2, score=state.second_score)
+        self.show_move(
+            player=1, image=self.move_image(state.first_move, self.scaling_factor * 2)
+        )
+        self.show_move(
+            player=2, image=self.move_image(state.second_move, self.scaling_factor * 2)
+        )
+
+    def hide_move(self, player: int):
+        """
+        This method is used to hide the move of the current player.
         """
 
         assert player in (1, 2), "Invalid Player"
 
         if player == 1:
-            remove_field(self.player_1_move)
+            hide_field(self.player_1_move)
+        else:
+            hide_field(self.player_2_move)
+
+    def hide_playground(self):
+        """
+        This method is used to hide the whole playground, i.e. every widget
+        placed on the root window. The places of the widgets are kept, so
+        that `show_playground` shows them again where they were.
+        """
+
+        self.playground_places = [
+            (widget, widget.place_info()) for widget in self.root.place_slaves()
+        ]
+
+        for widget, _ in self.playground_places:
+            widget.place_forget()
+
+    def show_playground(self):
+        """
+        This method is used to show the playground hidden by
+        `hide_playground` again.
+        """
+
+        for widget, place in self.playground_places:
+            widget.place(**place)
+
+        self.playground_places = list()
+
+    def on_round_result(self, result):
+        """
+        This method is subscribed to the match engine and displays the
+        result of the round which has just been played, after that it
+        either loads the next round or the ending screen.
+        """
+
+        _, text, fg = outcome_table[self.game_engine.computer_side][
+            outcome_index(result.first_move, result.second_move)
+        ]
+
+        probability = self.game_engine.win_probability()
+
+        if result.winner is None and probability is not None:
+            text = f"{text} ({probability:.1%} to win)"
+
+        self.config_status_label(fg=fg)
+        self.set_status(status=text)
+        self.set_player_score(player=1, score=result.first_score)
+        self.set_player_score(player=2, score=result.second_score)
+        self.hide_move(player=1)
+        self.hide_move(player=2)
+
+        self.player_1_choice.set(0)
+        self.player_2_choice.set(0)
+
+        if self.stall_monitor is not None:
+            self.stall_monitor.end_round(result.round_number)
+
+        if result.winner is None:
+            self.load_playground_dynamic_components()
+            self.phase = Phase.IDLE
+        else:
+            self.phase = Phase.ENDING
+            self.root.after(self.ending_delay, self.advance)
+
+    def hide_choices(self, side: str):
+        """
+        This method is used to hide the choices of the moves, the radio
+        buttons and the buttons on the given side of the playground.
+        """
+
+        assert side in ("left", "right"), f"Invalid Side [{side=}]"
+
+        if side == "left":
+            hide_field(
+                self.left_choice_rock,
+                self.left_choice_paper,
+                self.left_choice_scissor,
+                self.left_radio_button_rock,
+                self.left_radio_button_paper,
+                self.left_radio_button_scissor,
+                self.left_button_submit_choice,
+                self.left_button_clear_choice,
+                self.left_button_simulate,
+            )
+        else:
+            hide_field(
+                self.right_choice_rock,
+                self.right_choice_paper,
+                self.right_choice_scissor,
+                self.right_radio_button_rock,
+                self.right_radio_button_paper,
+                self.right_radio_button_scissor,
+                self.right_button_submit_choice,
+                self.right_button_clear_choice,
+                self.right_button_simulate,
+            )
+
+    def player_side(self, player: int) -> str:
+        """
+        This method returns the side of the playground of the player, where
+        the computer is the second player.
+        """
+
+        assert player in (1, 2), "Invalid Player"
+        assert self.game_engine.computer_side in (
+            "left",
+            "right",
+        ), f"Invalid Side [{self.game_engine.computer_side=}]"
+
+        if player == 2:
+            return self.game_engine.computer_side
+
+        return "left" if self.game_engine.computer_side == "right" else "right"
+
+    def show_move(self, player: int, image):
+        """
+        This method is used to show the image of the move played by the
+        player on its side of the playground.
+        """
+
+        move = self.player_1_move if player == 1 else self.player_2_move
+        move.config(image=image)
+
+        if self.player_side(player) == "left":
+            move.place(x=120, y=100)
         else:
-            remove_field(self.player_2_move)
+            move.place(x=self.width // 2 + 120, y=100)
 
     def place_next_move(self):
         """
@@ -150,63 +544,15 @@ class GUI:
             Moves.PAPER,
             Moves.SCISSOR,
         ), f"Invalid Move [{result=}]"
-        assert self.game_engine.computer_side in (
-            "left",
-            "right",
-        ), f"Invalid Side [{computer_side=}]"
 
-        if self.game_engine.computer_side == "right":
-            choice_rock = self.right_choice_rock
-            choice_paper = self.right_choice_paper
-            choice_scissor = self.right_choice_scissor
-            radio_button_rock = self.right_radio_button_rock
-            radio_button_paper = self.right_radio_button_paper
-            radio_button_scissor = self.right_radio_button_scissor
-            button_submit_choice = self.right_button_submit_choice
-            button_clear_choice = self.right_button_clear_choice
-        else:
-            choice_rock = self.left_choice_rock
-            choice_paper = self.left_choice_paper
-            choice_scissor = self.left_choice_scissor
-            radio_button_rock = self.left_radio_button_rock
-            radio_button_paper = self.left_radio_button_paper
-            radio_button_scissor = self.left_radio_button_scissor
-            button_submit_choice = self.left_button_submit_choice
-            button_clear_choice = self.left_button_clear_choice
-
-        if result == Moves.ROCK:
-            radio_button_rock.select()
-            choice = resize_image(self.image_url[Moves.ROCK], self.scaling_factor * 2)
-        elif result == Moves.PAPER:
-            radio_button_paper.select()
-            choice = resize_image(self.image_url[Moves.PAPER], self.scaling_factor * 2)
-        elif result == Moves.SCISSOR:
-            radio_button_scissor.select()
-            choice = resize_image(
-                self.image_url[Moves.SCISSOR], self.scaling_factor * 2
-            )
+        # Selecting the move on the radio buttons of the computer
+        self.player_2_choice.set(result)
 
-        remove_field(
-            choice_rock,
-            choice_paper,
-            choice_scissor,
-            radio_button_rock,
-            radio_button_paper,
-            radio_button_scissor,
-            button_submit_choice,
-            button_clear_choice,
+        self.hide_choices(self.game_engine.computer_side)
+        self.show_move(
+            player=2, image=self.move_image(result, self.scaling_factor * 2)
         )
 
-        self.player_2_move = Label(self.root, image=choice, borderwidth=0)
-        self.player_2_move.image = choice
-
-        assert self.game_engine.computer_side in ("left", "right"), f"Invalid Side [{self.game_engine.computer_side=}]"
-
-        if self.game_engine.computer_side == "right":
-            self.player_2_move.place(x=self.width // 2 + 120, y=100)
-        else:
-            self.player_2_move.place(x=120, y=100)
-
     def load_initial_window(self):
         """
         This method will initialize the main window and its contents which
@@ -216,6 +562,10 @@ class GUI:
         # Creating the root/master window
         self.root = Tk()
 
+        # Measuring the stalls of the event loop during every round
+        if self.report_stalls:
+            self.stall_monitor = StallMonitor(self.root, stall_interval)
+
         # Setting up the geometry of the screen
         self.root.geometry(f"{self.width}x{self.height}")
 
@@ -234,6 +584,47 @@ class GUI:
 
         self.load_starting_screen_static_components()
 
+        # Validating the assets and reporting the startup time once the
+        # starting screen has been mapped, an idle callback would run before
+        # the window is even mapped
+        self.first_frame_binding = self.canvas.bind("<Map>", self.on_first_frame)
+
+    def on_first_frame(self, *events):
+        """
+        This method is called once the starting screen has been mapped, it
+        draws the first frame, i.e. the pending redraws, after which the
+        missing assets are reported, and so is the time taken till the
+        first frame if the time at which the game started loading is known.
+        The first match is set up and the images of the playground are
+        preloaded meanwhile the user is on the starting screens.
+        """
+
+        self.canvas.unbind("<Map>", self.first_frame_binding)
+        self.root.update_idletasks()
+
+        if self.started is not None:
+            print(
+                f"First frame after {(perf_counter() - self.started) * 1000:.1f} ms",
+                file=stderr,
+            )
+
+        validate_assets(required_assets)
+
+        # Preparing the images of the playground while the user is on the
+        # starting screens
+        self.preload_sprites()
+        self.game_engine.prepare()
+
+    def about(self, *events):
+        """
+        This method shows the ABOUT screen, its module is imported only
+        when the ABOUT button is clicked.
+        """
+
+        from events.layer1 import about as events_about
+
+        events_about.on_click(*events)
+
     def load_starting_screen_static_components(self):
         """
         This method is the starting point of the gameplay. It contains
@@ -283,7 +674,7 @@ class GUI:
             self.canvas,
             text="ABOUT",
             **self.common_formatting_options,
-            command=events_about.on_click,
+            command=self.about,
         )
         self.button_play = Button(
             self.canvas,
@@ -334,7 +725,11 @@ class GUI:
         # number of rounds they are willing to play.
         self.number_of_rounds_label = Label(
             self.canvas,
-            text="NUMBER OF ROUNDS",
+            text=(
+                "NUMBER OF ROUNDS"
+                if self.game_engine.match_replay is None
+                else "ROUND TO REPLAY"
+            ),
             relief=RAISED,
             **self.common_formatting_options,
         )
@@ -374,6 +769,70 @@ class GUI:
         self.button_back.bind("<Enter>", effects_back.on_enter(self))
         self.button_back.bind("<Leave>", effects_back.on_leave(self))
 
+    def load_playground(self):
+        """
+        This method shows the playground for a new match. The components of
+        the playground are created for the first match only, every replay
+        reuses them.
+        """
+
+        self.canvas.pack_forget()
+
+        # The first match is set up along with the first frame, unless the
+        # playground is loaded before it
+        self.game_engine.prepare()
+
+        if not self.playground_loaded:
+            # Loading the pre-scaled images of the moves
+            self.load_sprites()
+            self.load_playground_static_components()
+            self.playground_loaded = True
+        else:
+            self.show_playground()
+
+        self.load_playground_sides()
+
+        # Computing the odds of the match, if they are shown, before the
+        # first round is played
+        self.game_engine.win_probability()
+
+        if self.game_engine.match_replay is not None:
+            self.phase = Phase.EVALUATE
+            self.load_replay_controls()
+            self.show_round(self.replay_round)
+        elif self.game_engine.autoplayer is None:
+            self.load_playground_dynamic_components()
+        else:
+            self.phase = Phase.EVALUATE
+            self.autoplay_batch = 1
+            self.root.after_idle(self.autoplay)
+
+    def load_replay_controls(self):
+        """
+        This method binds the keys moving through the rounds of a replayed
+        match. The left and right arrows move by a single round, the up and
+        down arrows move by the interval of the snapshots of the replay, home
+        and end move to the first and the last round and escape goes back to
+        the prompt of the round.
+        """
+
+        from events.layer2 import seek as events_seek
+
+        interval = self.game_engine.match_replay.interval
+        rounds = self.game_engine.match_replay.rounds
+
+        for key, step in (
+            ("<Left>", -1),
+            ("<Right>", 1),
+            ("<Down>", -interval),
+            ("<Up>", interval),
+            ("<Home>", -rounds),
+            ("<End>", rounds),
+        ):
+            self.root.bind(key, events_seek.on_key(self, step))
+
+        self.root.bind("<Escape>", events_seek.on_escape(self))
+
     def load_playground_static_components(self):
         """
         This method marks the starting point of the second layer
@@ -477,25 +936,14 @@ class GUI:
             bg=color["dark_grey_2"],
         )
 
-        assert self.game_engine.computer_side in (
-            "left",
-            "right",
-        ), f"Invalid Side [{self.game_engine.computer_side=}]"
-
-        if self.game_engine.computer_side == "left":
-            left_player, right_player = "Computer", "You"
-        else:
-            left_player, right_player = "You", "Computer"
-
         # Creating the label which will contain the names of the players
-        # in the screen
+        # in the screen, the names are set by load_playground_sides
         self.left_name_label = Label(
             self.root,
             bg=color["dark_grey_1"],
             fg=color["sky_blue"],
             font=("Mono", 20),
             padx=10,
-            text=left_player,
         )
 
         self.right_name_label = Label(
@@ -504,14 +952,13 @@ class GUI:
             fg=color["lime_green"],
             font=("Mono", 20),
             padx=10,
-            text=right_player,
         )
 
         self.player_1_score = StringVar()
-        self.player_1_score.set(str(self.game_engine.player[1]["score"]))
+        self.player_1_score.set(str(self.game_engine.state.first_score))
 
         self.player_2_score = StringVar()
-        self.player_2_score.set(str(self.game_engine.player[2]["score"]))
+        self.player_2_score.set(str(self.game_engine.state.second_score))
 
         self.points_frame = [None] * 6
 
@@ -557,86 +1004,41 @@ class GUI:
             bg=color["dark_grey_2"],
         )
 
-        # Creating the points table
+        # Creating the points table, the colors of the scores of both the
+        # players are set by load_playground_sides
         self.points_label = [None] * 6
 
-        assert self.game_engine.computer_side in (
-            "left",
-            "right",
-        ), f"Invalid Side [{self.game_engine.computer_side=}]"
-
-        if self.game_engine.computer_side == "right":
-            self.points_label[0] = Label(
-                self.root,
-                bg=color["dark_grey_1"],
-                fg=color["sky_blue"],
-                font=("Mono", 15, "underline"),
-                padx=10,
-                text="YOUR SCORE",
-            )
-
-            self.points_label[1] = Label(
-                self.root,
-                bg=color["dark_grey_1"],
-                fg=color["lime_green"],
-                font=("Mono", 15, "underline"),
-                padx=10,
-                text="COMPUTER'S SCORE",
-            )
-
-            self.points_label[3] = Label(
-                self.root,
-                bg=color["dark_grey_2"],
-                fg=color["sky_blue"],
-                font=("Mono", 20, "bold"),
-                padx=10,
-                textvariable=self.player_1_score,
-            )
-
-            self.points_label[4] = Label(
-                self.root,
-                bg=color["dark_grey_2"],
-                fg=color["lime_green"],
-                font=("Mono", 20, "bold"),
-                padx=10,
-                textvariable=self.player_2_score,
-            )
-        else:
-            self.points_label[0] = Label(
-                self.root,
-                bg=color["dark_grey_1"],
-                fg=color["lime_green"],
-                font=("Mono", 15, "underline"),
-                padx=10,
-                text="YOUR SCORE",
-            )
+        self.points_label[0] = Label(
+            self.root,
+            bg=color["dark_grey_1"],
+            font=("Mono", 15, "underline"),
+            padx=10,
+            text="YOUR SCORE",
+        )
 
-            self.points_label[1] = Label(
-                self.root,
-                bg=color["dark_grey_1"],
-                fg=color["sky_blue"],
-                font=("Mono", 15, "underline"),
-                padx=10,
-                text="COMPUTER'S SCORE",
-            )
+        self.points_label[1] = Label(
+            self.root,
+            bg=color["dark_grey_1"],
+            font=("Mono", 15, "underline"),
+            padx=10,
+            text="COMPUTER'S SCORE",
+        )
 
-            self.points_label[3] = Label(
-                self.root,
-                bg=color["dark_grey_2"],
-                fg=color["lime_green"],
-                font=("Mono", 20, "bold"),
-                padx=10,
-                textvariable=self.player_1_score,
-            )
+        self.points_label[3] = Label(
+            self.root,
+            bg=color["dark_grey_2"],
+            font=("Mono", 20, "bold"),
+            padx=10,
+            textvariable=self.player_1_score,
+        )
 
-            self.points_label[4] = Label(
-                self.root,
-                bg=color["dark_grey_2"],
-                fg=color["sky_blue"],
-                font=("Mono", 20, "bold"),
-                padx=10,
-                textvariable=self.player_2_score,
-            )
+        self.points_label[4] = Label(
+            self.root,
+            bg=color["dark_grey_2"],
+            font=("Mono", 20, "bold"),
+            padx=10,
+            textvariable=self.player_2_score,
+        )
 
         self.points_label[2] = Label(
             self.root,
@@ -653,7 +1055,6 @@ class GUI:
             fg=color["red_orange"],
             font=("Mono", 20, "bold"),
             padx=10,
-            text=str(self.game_engine.number_of_rounds),
         )
 
         # Placing the widgets on the screen
@@ -720,52 +1121,69 @@ class GUI:
             anchor=CENTER,
         )
 
-        self.game_engine.player[1]["choice"] = IntVar()
-        self.game_engine.player[2]["choice"] = IntVar()
+        self.player_1_choice = IntVar()
+        self.player_2_choice = IntVar()
 
-        self.load_playground_dynamic_components()
+        self.load_playground_widget_pool()
 
-    def load_playground_dynamic_components(self):
+    def load_playground_widget_pool(self):
         """
-        This method contains the dynamic components of the labels representing
-        the choices of the moves i.e. the move of ROCK, PAPER or SCISSOR
-        which the player will play.
+        This method creates all the dynamic components of the playground
+        once, i.e. the labels representing the choices of the moves, the
+        radio buttons, the SUBMIT and CLEAR SELECTION buttons of both the
+        sides and the labels of the moves played in a round. These widgets
+        are shown and hidden every round instead of being recreated.
         """
 
-        # Resizing the images
-        resized_rock = resize_image(self.image_url[Moves.ROCK], self.scaling_factor)
-        resized_paper = resize_image(self.image_url[Moves.PAPER], self.scaling_factor)
-        resized_scissor = resize_image(
-            self.image_url[Moves.SCISSOR], self.scaling_factor
-        )
+        # Obtaining the resized images
+        resized_rock = self.move_image(Moves.ROCK, self.scaling_factor)
+        resized_paper = self.move_image(Moves.PAPER, self.scaling_factor)
+        resized_scissor = self.move_image(Moves.SCISSOR, self.scaling_factor)
 
         # Creating the choices for the first player
         self.left_choice_rock = Label(
             self.root, image=resized_rock, borderwidth=0, anchor=NW
         )
-        self.left_choice_rock.image = resized_rock
         self.left_choice_paper = Label(
             self.root, image=resized_paper, borderwidth=0, anchor=NW
         )
-        self.left_choice_paper.image = resized_paper
         self.left_choice_scissor = Label(
             self.root, image=resized_scissor, borderwidth=0, anchor=NW
         )
-        self.left_choice_scissor.image = resized_scissor
 
         # Creating the choices for the second player
         self.right_choice_rock = Label(
             self.root, image=resized_rock, borderwidth=0, anchor=NW
         )
-        self.right_choice_rock.image = resized_rock
         self.right_choice_paper = Label(
             self.root, image=resized_paper, borderwidth=0, anchor=NW
         )
-        self.right_choice_paper.image = resized_paper
         self.right_choice_scissor = Label(
             self.root, image=resized_scissor, borderwidth=0, anchor=NW
         )
-        self.right_choice_scissor.image = resized_scissor
+
+        # Creating the labels of the moves played in a round
+        self.player_1_move = Label(self.root, borderwidth=0)
+        self.player_2_move = Label(self.root, borderwidth=0)
+
+        self.load_playground_controls(self.left_main_frame, self.right_main_frame)
+
+    def load_playground_controls(self, left_parent, right_parent):
+        """
+        This method creates the SUBMIT and CLEAR SELECTION buttons and the
+        radio buttons of both the sides of the playground, where the radio
+        buttons are created within the given parents.
+        """
+
+        from effects.layer2 import (
+            clear as effects_clear_choice,
+            submit as effects_submit_choice,
+        )
+        from events.layer2 import (
+            clear as events_clear_choice,
+            submit as events_submit_choice,
+            simulate as events_simulate,
+        )
 
         # Creating the submit and clear selection buttons in the left section
         self.left_button_submit_choice = Button(
@@ -809,61 +1227,59 @@ class GUI:
         self.right_button_clear_choice.config(bg=color["dark_grey_3"])
         self.right_button_clear_choice.config(fg=color["red_orange"])
 
-        common_kwargs = dict()
-
-        assert self.game_engine.computer_side in (
-            "left",
-            "right",
-        ), f"Invalid Side [{self.game_engine.computer_side=}]"
-
-        if self.game_engine.computer_side == "right":
-            player_variable_1 = self.game_engine.player[1]["choice"]
-            player_variable_2 = self.game_engine.player[2]["choice"]
-        else:
-            player_variable_1 = self.game_engine.player[2]["choice"]
-            player_variable_2 = self.game_engine.player[1]["choice"]
+        # Creating the buttons simulating the remaining rounds of the match
+        self.left_button_simulate = Button(
+            self.root,
+            text="SIMULATE",
+            **self.common_formatting_options,
+            borderwidth=0,
+            command=events_simulate.on_click(self),
+        )
+        self.left_button_simulate.config(bg=color["dark_grey_3"])
+        self.left_button_simulate.config(fg=color["peridot"])
 
-        common_kwargs[1] = {
-            "text": "",
-            "command": None,
-            "bg": color["dark_grey_3"],
-            "fg": color["raspberry"],
-            "borderwidth": 0,
-            "variable": player_variable_1,
-        }
+        self.right_button_simulate = Button(
+            self.root,
+            text="SIMULATE",
+            **self.common_formatting_options,
+            borderwidth=0,
+            command=events_simulate.on_click(self),
+        )
+        self.right_button_simulate.config(bg=color["dark_grey_3"])
+        self.right_button_simulate.config(fg=color["peridot"])
 
-        common_kwargs[2] = {
+        # The variables of the radio buttons are set by load_playground_sides
+        common_kwargs = {
             "text": "",
             "command": None,
             "bg": color["dark_grey_3"],
             "fg": color["raspberry"],
             "borderwidth": 0,
-            "variable": player_variable_2,
         }
 
         # Creating the radio buttons required for choice selection
         self.left_radio_button_rock = Radiobutton(
-            self.left_main_frame, **common_kwargs[1], value=1
+            left_parent, **common_kwargs, value=1
         )
 
         self.left_radio_button_paper = Radiobutton(
-            self.left_main_frame, **common_kwargs[1], value=2
+            left_parent, **common_kwargs, value=2
         )
 
         self.left_radio_button_scissor = Radiobutton(
-            self.left_main_frame, **common_kwargs[1], value=4
+            left_parent, **common_kwargs, value=4
         )
 
         self.right_radio_button_rock = Radiobutton(
-            self.right_main_frame, **common_kwargs[2], value=1
+            right_parent, **common_kwargs, value=1
         )
 
         self.right_radio_button_paper = Radiobutton(
-            self.right_main_frame, **common_kwargs[2], value=2
+            right_parent, **common_kwargs, value=2
         )
 
         self.right_radio_button_scissor = Radiobutton(
-            self.right_main_frame, **common_kwargs[2], value=4
+            right_parent, **common_kwargs, value=4
         )
 
         # Binding actions to the respective actions/events and effects
@@ -892,6 +1308,69 @@ class GUI:
             "<Leave>", effects_clear_choice.on_leave(self)
         )
 
+    def load_playground_sides(self):
+        """
+        This method configures the components of the playground which depend
+        upon the side of the computer or the number of rounds, i.e. the names
+        of the players, the colors of the scores and the variables of the
+        radio buttons.
+        """
+
+        assert self.game_engine.computer_side in (
+            "left",
+            "right",
+        ), f"Invalid Side [{self.game_engine.computer_side=}]"
+
+        first_player, second_player = self.game_engine.player_names()
+
+        if self.game_engine.computer_side == "right":
+            left_player, right_player = first_player, second_player
+            user_fg, computer_fg = color["sky_blue"], color["lime_green"]
+            left_variable, right_variable = self.player_1_choice, self.player_2_choice
+        else:
+            left_player, right_player = second_player, first_player
+            user_fg, computer_fg = color["lime_green"], color["sky_blue"]
+            left_variable, right_variable = self.player_2_choice, self.player_1_choice
+
+        self.left_name_label.config(text=left_player)
+        self.right_name_label.config(text=right_player)
+
+        self.points_label[0].config(fg=user_fg)
+        self.points_label[3].config(fg=user_fg)
+        self.points_label[1].config(fg=computer_fg)
+        self.points_label[4].config(fg=computer_fg)
+        self.points_label[5].config(text=str(self.game_engine.state.number_of_rounds))
+
+        self.set_radio_variables(left_variable, right_variable)
+
+    def set_radio_variables(self, left_variable: IntVar, right_variable: IntVar):
+        """
+        This method sets the variables of the radio buttons of both the
+        sides of the playground.
+        """
+
+        for radio_button in (
+            self.left_radio_button_rock,
+            self.left_radio_button_paper,
+            self.left_radio_button_scissor,
+        ):
+            radio_button.config(variable=left_variable)
+
+        for radio_button in (
+            self.right_radio_button_rock,
+            self.right_radio_button_paper,
+            self.right_radio_button_scissor,
+        ):
+            radio_button.config(variable=right_variable)
+
+    def load_playground_dynamic_components(self):
+        """
+        This method shows the dynamic components of the playground for the
+        next round, i.e. the labels representing the choices of the moves
+        (ROCK, PAPER or SCISSOR) of both the players, along with the radio
+        buttons and the buttons on the side of the user.
+        """
+
         # Placing the choice labels
         self.left_choice_rock.place(x=24, y=125)
         self.left_choice_paper.place(x=183, y=125)
@@ -913,6 +1392,9 @@ class GUI:
             self.left_button_clear_choice.place(
                 x=self.width // 2 - 175, y=self.height - 195
             )
+            self.left_button_simulate.place(
+                x=self.width // 4 - 50, y=self.height - 195
+            )
         else:
             self.right_radio_button_rock.place(x=60, y=240)
             self.right_radio_button_paper.place(x=220, y=240)
@@ -923,6 +1405,9 @@ class GUI:
             self.right_button_clear_choice.place(
                 x=self.width - 175, y=self.height - 195
             )
+            self.right_button_simulate.place(
+                x=3 * self.width // 4 - 50, y=self.height - 195
+            )
 
     def ending_screen(self):
         """
@@ -933,43 +1418,73 @@ class GUI:
         where everything gets dumped at last.
         """
 
-        self.update_root()
-        sleep(1)
+        from tkinter import messagebox
 
         assert self.game_engine.computer_side in (
             "left",
             "right",
         ), f"Invalid Side [{self.game_engine.computer_side=}]"
-        assert self.game_engine.winner in (
+        assert self.game_engine.state.winner in (
             1,
             2,
-        ), f"Invalid Winner [{self.game_engine.winner=}]"
+        ), f"Invalid Winner [{self.game_engine.state.winner=}]"
 
-        if self.game_engine.winner == 1:
+        if self.game_engine.autoplayer is not None:
+            name = self.game_engine.player_names()[self.game_engine.state.winner - 1]
+            text = f"{name} has won this game."
+        elif self.game_engine.state.winner == 1:
             text = "Congratulations! You have won. :D"
         else:
             text = "Oops! You have lost this game. :("
 
+        winner = self.game_engine.state.winner
+
         if self.game_engine.computer_side == "left":
-            fg = color["sky_blue" if self.game_engine.winner - 1 else "lime_green"]
+            fg = color["sky_blue" if winner - 1 else "lime_green"]
         else:
-            fg = color["lime_green" if self.game_engine.winner - 1 else "sky_blue"]
+            fg = color["lime_green" if winner - 1 else "sky_blue"]
 
-        self.status_label.config(fg=fg)
-        self.status.set(text)
+        self.config_status_label(fg=fg)
+        self.set_status(status=text)
 
         messagebox.showinfo(__project_name__, text)
 
         choice = messagebox.askyesno("Replay", "Do you want to play again ?")
 
         if choice:
-            self.end()
-            self.game_engine.play(replay=True)
+            self.replay()
         else:
             choice = messagebox.askyesno("Exit", "Do you want to exit this game ?")
-            self.end()
-            if not choice:
-                self.game_engine.play(replay=True)
+            if choice:
+                self.end()
+            else:
+                self.replay()
+
+    def replay(self):
+        """
+        This method is used to play again on the same root window. A new
+        match is set up by the game engine, the playground is reset and the
+        prompt of the number of rounds is shown again. All the widgets and
+        the images are kept for the next match.
+        """
+
+        self.game_engine.reset()
+
+        self.phase = Phase.IDLE
+        self.config_status_label(fg=color["lemon_yellow"])
+        self.set_status(status=__project_name__)
+        self.set_player_score(player=1, score=0)
+        self.set_player_score(player=2, score=0)
+        self.hide_move(player=1)
+        self.hide_move(player=2)
+        self.hide_playground()
+
+        self.text_box.delete(1.0, "end")
+        self.canvas.pack(fill=BOTH, expand=True)
+
+        # The lift method of a canvas raises its items, hence the one of the
+        # widget is called instead
+        Misc.tkraise(self.canvas)
 
     def start(self):
         """
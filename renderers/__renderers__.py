@@ -0,0 +1,16 @@
+#!/usr/bin/python3
+
+"""
+This module contains the registry of the renderers of the playground, which
+allows a renderer to be selected by its name.
+"""
+
+from sys import stderr
+
+try:
+    from gui import GUI
+    from renderers.canvas import CanvasGUI
+except ImportError as e:
+    print(e, file=stderr)
+
+renderers = {"widgets": GUI, "canvas": CanvasGUI}
@@ -0,0 +1,310 @@
+#!/usr/bin/python3
+
+"""
+This module contains the canvas renderer of the playground. The whole
+playground is drawn on a single Canvas, where the frames are rectangles,
+the labels are text items and the images of the moves are image items, all
+of which are updated using `itemconfig` and `coords` instead of being
+separate widgets. Only the radio buttons and the buttons remain widgets,
+which are embedded in the canvas.
+"""
+
+from sys import stderr
+from tkinter import Canvas, IntVar, NW, CENTER
+
+try:
+    from gui import GUI
+    from constants.moves import Moves
+    from constants.colors_table import color
+    from constants.constants import __project_name__
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class CanvasGUI(GUI):
+    """
+    This class renders the playground on a single Canvas, the starting
+    screens and the flow of the game are the same as those of GUI.
+    """
+
+    def load_playground_static_components(self):
+        """
+        This method creates the canvas of the playground along with all its
+        items, which are shown and hidden every round.
+        """
+
+        self.root["bg"] = color["dark_grey_1"]
+
+        width, height = self.width, self.height
+        third = (width - 20) // 3
+
+        self.playground = Canvas(
+            self.root,
+            width=width,
+            height=height,
+            bg=color["dark_grey_1"],
+            highlightthickness=0,
+        )
+        self.playground.place(x=0, y=0)
+
+        # Drawing the frames, in the same order as the frames of GUI
+        for x, y, frame_width, frame_height, fill in (
+            (0, 0, width, 45, "dark_grey_2"),
+            (0, height - 22, width, 45, "dark_grey_2"),
+            (width // 2 - 10, 45, 20, height - 67, "dark_grey_1"),
+            (0, 45, 10, height - 67, "dark_grey_2"),
+            (width - 10, 45, 10, height - 67, "dark_grey_2"),
+            (10, 45, (width - 40) // 2, height - 182, "sky_blue"),
+            (width // 2 + 10, 45, (width - 40) // 2, height - 182, "lime_green"),
+            (12, 95, (width - 40) // 2 - 4, height - 237, "dark_grey_3"),
+            (width // 2 + 12, 95, (width - 40) // 2 - 4, height - 237, "dark_grey_3"),
+            (12, 47, (width - 40) // 2 - 4, 50, "dark_grey_2"),
+            (width // 2 + 12, 47, (width - 40) // 2 - 4, 50, "dark_grey_2"),
+            (10, height - 140, third, 58, "dark_grey_1"),
+            (10 + third, height - 140, third, 58, "dark_grey_1"),
+            (10 + 2 * third - 1, height - 140, third + 2, 58, "dark_grey_1"),
+            (12, height - 78, (width - 28) // 3, 54, "dark_grey_2"),
+            (12 + third, height - 78, (width - 28) // 3, 54, "dark_grey_2"),
+            (12 + 2 * third, height - 78, (width - 28) // 3, 54, "dark_grey_2"),
+        ):
+            self.playground.create_rectangle(
+                x, y, x + frame_width, y + frame_height, fill=color[fill], width=0
+            )
+
+        self.status_item = self.playground.create_text(
+            width // 2,
+            22,
+            anchor=CENTER,
+            fill=color["lemon_yellow"],
+            font=("Mono", int(self.font_size * 2.5)),
+            text=__project_name__,
+        )
+
+        # The names of the players are drawn on a background of their own,
+        # which is fitted to the names by load_playground_sides
+        self.name_items = dict()
+        for side, x, fg in (
+            ("left", width // 4, "sky_blue"),
+            ("right", 3 * width // 4, "lime_green"),
+        ):
+            background = self.playground.create_rectangle(
+                0, 0, 0, 0, fill=color["dark_grey_1"], width=0
+            )
+            text = self.playground.create_text(
+                x, 70, anchor=CENTER, fill=color[fg], font=("Mono", 20)
+            )
+            self.name_items[side] = (text, background)
+
+        # Creating the points table
+        self.points_items = [
+            self.playground.create_text(x, y, anchor=CENTER, font=font, text=text)
+            for x, y, font, text in (
+                (width // 6, height - 112, ("Mono", 15, "underline"), "YOUR SCORE"),
+                (
+                    third + width // 6,
+                    height - 112,
+                    ("Mono", 15, "underline"),
+                    "COMPUTER'S SCORE",
+                ),
+                (
+                    2 * third + width // 6 + 5,
+                    height - 112,
+                    ("Mono", 15, "underline"),
+                    "TOTAL",
+                ),
+                (width // 6, height - 51, ("Mono", 20, "bold"), "0"),
+                (third + width // 6, height - 51, ("Mono", 20, "bold"), "0"),
+                (2 * third + width // 6 + 5, height - 51, ("Mono", 20, "bold"), ""),
+            )
+        ]
+        self.playground.itemconfig(self.points_items[2], fill=color["red_orange"])
+        self.playground.itemconfig(self.points_items[5], fill=color["red_orange"])
+
+        self.player_1_choice = IntVar()
+        self.player_2_choice = IntVar()
+
+        # Creating the choices of the moves of both the players
+        self.choice_items = {
+            side: [
+                self.playground.create_image(
+                    x,
+                    125,
+                    anchor=NW,
+                    image=self.move_image(move, self.scaling_factor),
+                    state="hidden",
+                )
+                for x, move in zip(
+                    positions, (Moves.ROCK, Moves.PAPER, Moves.SCISSOR)
+                )
+            ]
+            for side, positions in (
+                ("left", (24, 183, width // 2 - 159)),
+                ("right", (width // 2 + 24, width // 2 + 183, width - 159)),
+            )
+        }
+
+        # Creating the moves played in a round
+        self.move_items = {
+            player: self.playground.create_image(0, 100, anchor=NW, state="hidden")
+            for player in (1, 2)
+        }
+
+        self.load_playground_controls(self.playground, self.playground)
+
+        # Embedding the radio buttons and the buttons in the canvas
+        self.control_items = {
+            side: [
+                self.playground.create_window(
+                    x, y, anchor=NW, window=control, state="hidden"
+                )
+                for x, y, control in controls
+            ]
+            for side, controls in (
+                (
+                    "left",
+                    (
+                        (72, 335, self.left_radio_button_rock),
+                        (232, 335, self.left_radio_button_paper),
+                        (392, 335, self.left_radio_button_scissor),
+                        (35, height - 195, self.left_button_submit_choice),
+                        (width // 2 - 175, height - 195, self.left_button_clear_choice),
+                        (width // 4 - 50, height - 195, self.left_button_simulate),
+                    ),
+                ),
+                (
+                    "right",
+                    (
+                        (width // 2 + 72, 335, self.right_radio_button_rock),
+                        (width // 2 + 232, 335, self.right_radio_button_paper),
+                        (width // 2 + 392, 335, self.right_radio_button_scissor),
+                        (
+                            width // 2 + 35,
+                            height - 195,
+                            self.right_button_submit_choice,
+                        ),
+                        (width - 175, height - 195, self.right_button_clear_choice),
+                        (3 * width // 4 - 50, height - 195, self.right_button_simulate),
+                    ),
+                ),
+            )
+        }
+
+    def load_playground_sides(self):
+        """
+        This method configures the items of the playground which depend upon
+        the side of the computer or the number of rounds.
+        """
+
+        assert self.game_engine.computer_side in (
+            "left",
+            "right",
+        ), f"Invalid Side [{self.game_engine.computer_side=}]"
+
+        first_player, second_player = self.game_engine.player_names()
+
+        if self.game_engine.computer_side == "right":
+            names = {"left": first_player, "right": second_player}
+            user_fg, computer_fg = color["sky_blue"], color["lime_green"]
+            left_variable, right_variable = self.player_1_choice, self.player_2_choice
+        else:
+            names = {"left": second_player, "right": first_player}
+            user_fg, computer_fg = color["lime_green"], color["sky_blue"]
+            left_variable, right_variable = self.player_2_choice, self.player_1_choice
+
+        for side, (text, background) in self.name_items.items():
+            self.playground.itemconfig(text, text=names[side])
+            x0, y0, x1, y1 = self.playground.bbox(text)
+            self.playground.coords(background, x0 - 10, y0, x1 + 10, y1)
+
+        self.playground.itemconfig(self.points_items[0], fill=user_fg)
+        self.playground.itemconfig(self.points_items[3], fill=user_fg)
+        self.playground.itemconfig(self.points_items[1], fill=computer_fg)
+        self.playground.itemconfig(self.points_items[4], fill=computer_fg)
+        self.playground.itemconfig(
+            self.points_items[5], text=str(self.game_engine.state.number_of_rounds)
+        )
+
+        self.set_radio_variables(left_variable, right_variable)
+
+    def load_playground_dynamic_components(self):
+        """
+        This method shows the choices of the moves of both the players, along
+        with the radio buttons and the buttons on the side of the user.
+        """
+
+        for items in self.choice_items.values():
+            for item in items:
+                self.playground.itemconfig(item, state="normal")
+
+        for item in self.control_items[self.player_side(1)]:
+            self.playground.itemconfig(item, state="normal")
+
+    def config_status_label(self, fg):
+        """
+        This method is used to configure the status.
+        """
+
+        self.playground.itemconfig(self.status_item, fill=fg)
+
+    def set_status(self, status: str):
+        """
+        This method is used to set status.
+        """
+
+        self.playground.itemconfig(self.status_item, text=status)
+
+    def set_player_score(self, player: int, score: int):
+        """
+        This method is used to set the score of the current player.
+        """
+
+        assert player in (1, 2), "Invalid Player"
+
+        self.playground.itemconfig(self.points_items[2 + player], text=str(score))
+
+    def hide_move(self, player: int):
+        """
+        This method is used to hide the move of the current player.
+        """
+
+        assert player in (1, 2), "Invalid Player"
+
+        self.playground.itemconfig(self.move_items[player], state="hidden")
+
+    def hide_playground(self):
+        """
+        This method is used to hide the canvas of the playground.
+        """
+
+        self.playground.place_forget()
+
+    def show_playground(self):
+        """
+        This method is used to show the canvas of the playground again.
+        """
+
+        self.playground.place(x=0, y=0)
+
+    def hide_choices(self, side: str):
+        """
+        This method is used to hide the choices of the moves, the radio
+        buttons and the buttons on the given side of the playground.
+        """
+
+        assert side in ("left", "right"), f"Invalid Side [{side=}]"
+
+        for item in self.choice_items[side] + self.control_items[side]:
+            self.playground.itemconfig(item, state="hidden")
+
+    def show_move(self, player: int, image):
+        """
+        This method is used to show the image of the move played by the
+        player on its side of the playground.
+        """
+
+        x = 120 if self.player_side(player) == "left" else self.width // 2 + 120
+
+        self.playground.coords(self.move_items[player], x, 100)
+        self.playground.itemconfig(
+            self.move_items[player], image=image, state="normal"
+        )
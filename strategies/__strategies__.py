@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+
+"""
+This module contains the registry of all the strategies, which allows a
+strategy to be selected by its name.
+"""
+
+from sys import stderr
+from importlib.util import find_spec
+
+try:
+    from engine.rng import MoveSource
+    from strategies.basic import (
+        RandomStrategy,
+        ConstantStrategy,
+        CycleStrategy,
+        MixStrategy,
+    )
+    from strategies.frequency import FrequencyStrategy
+    from strategies.markov import MarkovStrategy
+    from strategies.ngram import NGramStrategy
+    from strategies.history import HistoryMatchStrategy
+    from strategies.ensemble import EnsembleStrategy
+except ImportError as e:
+    print(e, file=stderr)
+
+# The ensemble strategy is only available when NumPy is installed, which is
+# not imported until an ensemble is created
+if find_spec("numpy") is None:
+    EnsembleStrategy = None
+
+strategies = {
+    strategy.name: strategy
+    for strategy in (
+        RandomStrategy,
+        ConstantStrategy,
+        CycleStrategy,
+        MixStrategy,
+        FrequencyStrategy,
+        MarkovStrategy,
+        NGramStrategy,
+        HistoryMatchStrategy,
+        EnsembleStrategy,
+    )
+    if strategy is not None
+}
+
+
+def create_strategy(name: str, seed: int = None, stream: tuple = ()):
+    """
+    This function creates a new instance of the strategy registered under
+    the given name, using the source of random moves with the given seed
+    and stream.
+    """
+
+    if name not in strategies:
+        raise ValueError(f"Unknown Strategy [{name=}]")
+
+    return strategies[name](MoveSource(seed, stream))
@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+
+"""
+This module contains the base class of the strategies used by the computer
+to play the Rock, Paper and Scissors game.
+"""
+
+from array import array
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from constants.outcomes import beaten_by
+    from engine.rng import MoveSource
+except ImportError as e:
+    print(e, file=stderr)
+
+# The moves in the order of their indices, and the index of every move
+moves = (Moves.ROCK, Moves.PAPER, Moves.SCISSOR)
+move_index = {move: index for index, move in enumerate(moves)}
+
+# The move which beats the move of the given index
+counter_moves = tuple(beaten_by[move] for move in moves)
+
+
+class RingBuffer:
+    """
+    Bounded history of small integers (0 to 255) stored in a flat array.
+    Once the buffer is full every new value overwrites the oldest one, so
+    the memory does not grow with the length of the session.
+    """
+
+    def __init__(self, capacity: int):
+        assert capacity > 0, f"Invalid Capacity [{capacity=}]"
+
+        self.values = array("B", bytes(capacity))
+        self.capacity = capacity
+        self.size = 0
+        self.position = 0
+
+    def push(self, value: int) -> int:
+        """
+        This method appends a value in constant time and returns the value
+        which got evicted, or None if the buffer was not full yet.
+        """
+
+        evicted = self.values[self.position] if self.size == self.capacity else None
+
+        self.values[self.position] = value
+        self.position = (self.position + 1) % self.capacity
+
+        if evicted is None:
+            self.size += 1
+
+        return evicted
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """
+        This method iterates over the values from the oldest to the newest.
+        """
+
+        start = (self.position - self.size) % self.capacity
+
+        for offset in range(self.size):
+            yield self.values[(start + offset) % self.capacity]
+
+
+class Strategy:
+    """
+    Base class of every strategy.
+
+    A strategy is asked for its move through `next_move` and is then told
+    about the move played by its opponent in the same round through
+    `observe`.
+
+    Strategies which ignore the moves of the opponent are `memoryless`, and
+    can also draw many moves at once through `draw`, which allows matches
+    against them to be played by the vectorized engine.
+    """
+
+    name = None
+    memoryless = False
+
+    def __init__(self, rng: MoveSource = None):
+        self.rng = rng or MoveSource()
+
+    def next_move(self) -> Moves:
+        """
+        This method returns the move which will be played in the next
+        round.
+        """
+
+        raise NotImplementedError
+
+    def draw(self, count: int):
+        """
+        This method returns the moves of the next `count` rounds as a NumPy
+        array of `Moves` values, it is only available for the memoryless
+        strategies.
+        """
+
+        raise NotImplementedError
+
+    def observe(self, opponent_move: Moves):
+        """
+        This method is called with the move of the opponent after every
+        round. By default the moves of the opponent are ignored.
+        """
+
+    def counter(self, counts) -> Moves:
+        """
+        This method returns the move which beats the most frequent of the
+        three counts (indexed like `moves`) of the moves of the opponent,
+        breaking ties at random. If nothing has been counted yet, a random
+        move is returned.
+        """
+
+        best = max(counts)
+
+        if best <= 0:
+            return self.rng.choice(moves)
+
+        if counts.count(best) == 1:
+            return counter_moves[counts.index(best)]
+
+        return self.rng.choice(
+            [counter_moves[index] for index in range(3) if counts[index] == best]
+        )
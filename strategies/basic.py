@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+
+"""
+This module contains the basic strategies which do not adapt to the moves
+of the opponent.
+"""
+
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from engine.rng import MoveSource
+    from strategies.base import Strategy, moves
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class RandomStrategy(Strategy):
+    """
+    This strategy plays every move uniformly at random, straight from the
+    blocks of moves drawn by its source.
+    """
+
+    name = "random"
+    memoryless = True
+
+    def __init__(self, rng: MoveSource = None):
+        super().__init__(rng)
+        self.next_move = self.rng.next_move
+
+    def draw(self, count: int):
+        # NumPy is only required for drawing many moves at once
+        import numpy as np
+
+        return np.array(moves, np.uint8)[self.rng.generator.integers(0, 3, count)]
+
+
+class ConstantStrategy(Strategy):
+    """
+    This strategy always plays the same move, which is ROCK by default.
+    """
+
+    name = "rock"
+    memoryless = True
+
+    def __init__(self, rng: MoveSource = None, move: Moves = Moves.ROCK):
+        super().__init__(rng)
+        self.move = move
+
+    def next_move(self) -> Moves:
+        return self.move
+
+    def draw(self, count: int):
+        import numpy as np
+
+        return np.full(count, self.move, np.uint8)
+
+
+class CycleStrategy(Strategy):
+    """
+    This strategy plays ROCK, PAPER and SCISSOR one after the other.
+    """
+
+    name = "cycle"
+    memoryless = True
+
+    def __init__(self, rng: MoveSource = None):
+        super().__init__(rng)
+        self.moves = tuple(Moves)
+        self.index = self.rng.randrange(len(self.moves))
+
+    def next_move(self) -> Moves:
+        self.index = (self.index + 1) % len(self.moves)
+        return self.moves[self.index]
+
+    def draw(self, count: int):
+        import numpy as np
+
+        indices = (self.index + 1 + np.arange(count)) % len(self.moves)
+        self.index = (self.index + count) % len(self.moves)
+        return np.array(self.moves, np.uint8)[indices]
+
+
+class MixStrategy(Strategy):
+    """
+    This strategy plays ROCK, PAPER and SCISSOR at random with fixed
+    weights, which are all equal by default.
+    """
+
+    name = "mix"
+    memoryless = True
+
+    def __init__(self, rng: MoveSource = None, weights: tuple = (1, 1, 1)):
+        super().__init__(rng)
+
+        assert len(weights) == 3, f"Invalid Weights [{weights=}]"
+        assert min(weights) >= 0 < sum(weights), f"Invalid Weights [{weights=}]"
+
+        self.weights = tuple(weights)
+
+    def next_move(self) -> Moves:
+        return self.rng.choices(moves, self.weights)[0]
+
+    def draw(self, count: int):
+        import numpy as np
+
+        probabilities = np.array(self.weights, float) / sum(self.weights)
+        indices = self.rng.generator.choice(3, count, p=probabilities)
+        return np.array(moves, np.uint8)[indices]
@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+
+"""
+This module contains the meta strategy which mixes many base predictors
+using multiplicative weights.
+"""
+
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from engine.rng import MoveSource
+    from strategies.base import Strategy, moves, move_index
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class EnsembleStrategy(Strategy):
+    """
+    This strategy runs a set of base predictors side by side and samples its
+    move from their recommendations, weighted by the Hedge (multiplicative
+    weights) algorithm according to the virtual score every predictor would
+    have made so far.
+
+    There is one base predictor for every pair of an n-gram order from
+    `orders` (order 0 simply counts the moves of the opponent) and a decay
+    from `decays`. The state of all the `k` predictors is kept in NumPy
+    arrays, i.e. the counts of shape (k, 3 ** max order, 3), so that every
+    round the k x 3 matrix of predictions and the update of all the counts
+    and weights are computed in a few vectorized operations.
+
+    A predictor abstains in a context it has not seen yet, i.e. it neither
+    recommends a move nor gets its weight updated, and ties between the
+    counts are broken at random like in `Strategy.counter`. When all the
+    predictors abstain, e.g. in the first round, a random move is played.
+    """
+
+    name = "ensemble"
+    rescale_limit = 1e150
+
+    # payoff[recommended move][opponent move] of the indices of the moves,
+    # where the recommendation of an abstaining predictor has the index 3
+    payoff = ((0, -1, 1), (1, 0, -1), (-1, 1, 0), (0, 0, 0))
+    counter_indices = (1, 2, 0)
+    abstain = 3
+
+    def __init__(
+        self,
+        rng: MoveSource = None,
+        orders: tuple = (0, 1, 2, 3, 4, 5),
+        decays: tuple = (1.0, 0.99, 0.95, 0.85, 0.7),
+        learning_rate: float = 0.2,
+    ):
+        super().__init__(rng)
+
+        # NumPy is imported by the first ensemble created rather than along
+        # with the registry of the strategies
+        import numpy as np
+
+        self.bincount = np.bincount
+        self.where = np.where
+        self.counter_indices = np.array(self.counter_indices)
+
+        assert orders and decays, "No Predictors"
+        assert all(0 < decay <= 1 for decay in decays), f"Invalid Decay [{decays=}]"
+
+        orders, decays = np.meshgrid(orders, decays, indexing="ij")
+        orders, decays = orders.ravel().astype(np.int64), decays.ravel()
+
+        size = len(orders)
+        contexts = int(3 ** orders.max())
+
+        # The counts of all the predictors as rows of 3 counts, where the
+        # row of the current context of the i-th predictor is rows[i], and
+        # following[row, move] is the row of the context after that move
+        self.counts = np.zeros((size * contexts, 3))
+        self.rows = np.arange(size) * contexts
+        context = np.arange(contexts)[None, :, None]
+        move = np.arange(3)[None, None, :]
+        self.following = (
+            self.rows[:, None, None] + (3 * context + move) % (3**orders)[:, None, None]
+        ).reshape(-1, 3)
+
+        # The increments grow by 1 / decay every round instead of decaying
+        # all the counts, the largest one is tracked for rescaling
+        self.growth = 1 / decays
+        self.increments = np.ones(size)
+        self.largest_growth = float(self.growth.max())
+        self.largest_increment = 1.0
+
+        # Every weight gets multiplied by factors[opponent move][recommended
+        # move] after every round, i.e. exp(learning_rate * payoff), hence the
+        # weights are rescaled every `rescale_interval` rounds at the latest
+        self.weights = np.ones(size)
+        self.factors = np.exp(
+            learning_rate * np.array(self.payoff, np.float64).T
+        ).copy()
+        self.rescale_interval = max(1, int(100 / learning_rate))
+        self.round_number = 0
+        self.recommendations = np.full(size, self.abstain, dtype=np.int64)
+        self.own_move = None
+
+    def next_move(self) -> Moves:
+        counts = self.counts[self.rows]
+        best = counts.max(axis=1)
+        ties = counts == best[:, None]
+        predictions = ties.argmax(axis=1)
+
+        # Ties are broken by drawing a random key for every tied count, the
+        # rows without any count abstain anyway
+        tied = (ties.sum(axis=1) > 1) & (best > 0)
+
+        if tied.any():
+            keys = (1 + self.rng.generator.random((int(tied.sum()), 3))) * ties[tied]
+            predictions[tied] = keys.argmax(axis=1)
+
+        # Every predictor recommends the move which beats the move it
+        # predicts, i.e. the next move in the order of the indices
+        self.recommendations = self.where(
+            best > 0, self.counter_indices[predictions], self.abstain
+        )
+
+        rock, paper, scissor, _ = self.bincount(
+            self.recommendations, weights=self.weights, minlength=4
+        ).tolist()
+        total = rock + paper + scissor
+
+        if total <= 0:
+            self.own_move = self.rng.choice(moves)
+            return self.own_move
+
+        threshold = self.rng.random() * total
+
+        if threshold < rock:
+            self.own_move = Moves.ROCK
+        elif threshold < rock + paper:
+            self.own_move = Moves.PAPER
+        else:
+            self.own_move = Moves.SCISSOR
+
+        return self.own_move
+
+    def observe(self, opponent_move: Moves):
+        index = move_index[opponent_move]
+
+        if self.own_move is not None:
+            self.weights *= self.factors[index][self.recommendations]
+            self.round_number += 1
+
+            if not self.round_number % self.rescale_interval:
+                self.weights /= self.weights.max()
+
+        self.increments *= self.growth
+        self.largest_increment *= self.largest_growth
+        self.counts[self.rows, index] += self.increments
+        self.rows = self.following[self.rows, index]
+
+        if self.largest_increment > self.rescale_limit:
+            counts = self.counts.reshape(len(self.increments), -1, 3)
+            counts /= self.increments[:, None, None]
+            self.increments[:] = 1
+            self.largest_increment = 1.0
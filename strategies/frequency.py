@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+
+"""
+This module contains the strategy which counts the moves of the opponent.
+"""
+
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from engine.rng import MoveSource
+    from strategies.base import Strategy, RingBuffer, move_index
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class FrequencyStrategy(Strategy):
+    """
+    This strategy predicts that the opponent plays their most frequent move
+    out of the last `window` moves, and plays the move which beats it.
+
+    Both updating the counts and predicting take constant time.
+    """
+
+    name = "frequency"
+
+    def __init__(self, rng: MoveSource = None, window: int = 1000):
+        super().__init__(rng)
+        self.counts = [0, 0, 0]
+        self.history = RingBuffer(window)
+
+    def observe(self, opponent_move: Moves):
+        index = move_index[opponent_move]
+        self.counts[index] += 1
+
+        evicted = self.history.push(index)
+
+        if evicted is not None:
+            self.counts[evicted] -= 1
+
+    def next_move(self) -> Moves:
+        return self.counter(self.counts)
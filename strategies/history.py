@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+
+"""
+This module contains the strategy which looks for the longest match of the
+recent history of the game in the past.
+"""
+
+from array import array
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from engine.rng import MoveSource
+    from strategies.base import Strategy, moves, move_index, counter_moves
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class HistoryMatchStrategy(Strategy):
+    """
+    This strategy finds the longest suffix of the history of the game which
+    has occurred before, predicts that the opponent plays the move which
+    followed that earlier occurrence and plays the move which beats it.
+
+    The history is a string over the alphabet of the 9 pairs of moves, i.e.
+    `3 * own move + opponent move`, which is indexed by a suffix automaton
+    built online. Extending the automaton takes amortized constant time per
+    round, and the longest earlier suffix is the suffix link of the state of
+    the whole history, whose first end position is recorded when the state
+    is created.
+
+    The automaton holds at most two states per round, hence it is rebuilt
+    from scratch once the history reaches `max_history` rounds.
+    """
+
+    name = "history"
+    alphabet = 9
+
+    def __init__(self, rng: MoveSource = None, max_history: int = 1 << 20):
+        super().__init__(rng)
+
+        assert max_history > 1, f"Invalid History Size [{max_history=}]"
+
+        self.max_history = max_history
+        self.own_move = None
+        self.reset()
+
+    def reset(self):
+        """
+        This method forgets the whole history.
+        """
+
+        # The symbols of the history, and for every state of the automaton
+        # its transitions, suffix link, length and first end position
+        self.history = array("B")
+        self.transitions = array("i", [-1] * self.alphabet)
+        self.link = array("i", [-1])
+        self.length = array("i", [0])
+        self.first_end = array("i", [-1])
+        self.last = 0
+        self.prediction = None
+
+    def __new_state__(self, length: int, first_end: int, transitions=None) -> int:
+        self.transitions.extend(transitions or [-1] * self.alphabet)
+        self.link.append(-1)
+        self.length.append(length)
+        self.first_end.append(first_end)
+
+        return len(self.length) - 1
+
+    def __extend__(self, symbol: int):
+        """
+        This method appends a symbol to the history and extends the suffix
+        automaton accordingly.
+        """
+
+        transitions, link, length = self.transitions, self.link, self.length
+        alphabet = self.alphabet
+
+        position = len(self.history)
+        self.history.append(symbol)
+
+        current = self.__new_state__(length[self.last] + 1, position)
+        state = self.last
+
+        while state != -1 and transitions[state * alphabet + symbol] == -1:
+            transitions[state * alphabet + symbol] = current
+            state = link[state]
+
+        if state == -1:
+            link[current] = 0
+        else:
+            following = transitions[state * alphabet + symbol]
+
+            if length[state] + 1 == length[following]:
+                link[current] = following
+            else:
+                start = following * alphabet
+                clone = self.__new_state__(
+                    length[state] + 1,
+                    self.first_end[following],
+                    transitions[start : start + alphabet],
+                )
+                link[clone] = link[following]
+
+                while (
+                    state != -1 and transitions[state * alphabet + symbol] == following
+                ):
+                    transitions[state * alphabet + symbol] = clone
+                    state = link[state]
+
+                link[following] = link[current] = clone
+
+        self.last = current
+
+    def observe(self, opponent_move: Moves):
+        if self.own_move is None:
+            return
+
+        if len(self.history) >= self.max_history:
+            self.reset()
+
+        self.__extend__(3 * move_index[self.own_move] + move_index[opponent_move])
+
+        # The suffix link of the whole history is its longest suffix which
+        # has occurred before, and its first occurrence ends before the end
+        # of the history, hence it is followed by another symbol
+        match = self.link[self.last]
+
+        if match > 0:
+            self.prediction = self.history[self.first_end[match] + 1] % 3
+        else:
+            self.prediction = None
+
+    def next_move(self) -> Moves:
+        if self.prediction is None:
+            self.own_move = self.rng.choice(moves)
+        else:
+            self.own_move = counter_moves[self.prediction]
+
+        return self.own_move
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+
+"""
+This module contains the strategy which models the moves of the opponent
+as a Markov chain.
+"""
+
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from engine.rng import MoveSource
+    from strategies.base import Strategy, RingBuffer, move_index
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class MarkovStrategy(Strategy):
+    """
+    This strategy counts the transitions between consecutive moves of the
+    opponent over the last `window` rounds, predicts the most likely move
+    following the last move of the opponent and plays the move which beats
+    it.
+
+    The transitions are stored as codes `3 * previous + next` in a flat
+    table of 9 counts, hence both updating and predicting take constant
+    time.
+    """
+
+    name = "markov"
+
+    def __init__(self, rng: MoveSource = None, window: int = 1000):
+        super().__init__(rng)
+        self.counts = [0] * 9
+        self.history = RingBuffer(window)
+        self.last = None
+
+    def observe(self, opponent_move: Moves):
+        index = move_index[opponent_move]
+
+        if self.last is not None:
+            transition = 3 * self.last + index
+            self.counts[transition] += 1
+
+            evicted = self.history.push(transition)
+
+            if evicted is not None:
+                self.counts[evicted] -= 1
+
+        self.last = index
+
+    def next_move(self) -> Moves:
+        if self.last is None:
+            return self.counter((0, 0, 0))
+
+        start = 3 * self.last
+
+        return self.counter(self.counts[start : start + 3])
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+
+"""
+This module contains the strategy which models the moves of the opponent
+using n-grams of several orders at once.
+"""
+
+from array import array
+from sys import stderr
+
+try:
+    from constants.moves import Moves
+    from engine.rng import MoveSource
+    from strategies.base import Strategy, move_index
+except ImportError as e:
+    print(e, file=stderr)
+
+
+class NGramStrategy(Strategy):
+    """
+    This strategy counts which move the opponent played after each of their
+    last `k` moves, for every order `k` from 1 to `max_order`, and plays the
+    move which beats the move predicted by the mixture of all the orders.
+
+    A context of order `k` is the base-3 code of the last `k` moves of the
+    opponent, thus the counts of all the orders are kept in one flat array
+    where the counts of the order `k` start at `layout[k - 1][0]` and hold
+    three counts per context (i.e. 3 ** (k + 1) counts).
+
+    The counts decay exponentially by `decay` every round, so that the model
+    keeps up with opponents changing their style. Instead of scaling the
+    whole table every round, new counts are added with a weight growing by
+    `1 / decay` per round, and the table is only scaled back once that
+    weight gets too large.
+    """
+
+    name = "ngram"
+    rescale_limit = 1e150
+
+    def __init__(self, rng: MoveSource = None, max_order: int = 6, decay: float = 0.98):
+        super().__init__(rng)
+
+        assert max_order > 0, f"Invalid Order [{max_order=}]"
+        assert 0 < decay <= 1, f"Invalid Decay [{decay=}]"
+
+        # Offset of the counts and number of contexts of every order
+        self.layout = list()
+
+        size = 0
+        for order in range(1, max_order + 1):
+            self.layout.append((size, 3**order))
+            size += 3 ** (order + 1)
+
+        self.counts = array("d", bytes(8 * size))
+        self.max_order = max_order
+        self.growth = 1 / decay
+        self.weight = 1.0
+        self.seen = 0
+
+        # Base-3 code of the last `max_order` moves of the opponent with the
+        # latest move as the least significant digit, i.e. the context of
+        # the order `k` is `context % 3 ** k`
+        self.context = 0
+
+    def observe(self, opponent_move: Moves):
+        index = move_index[opponent_move]
+        counts, context = self.counts, self.context
+
+        self.weight *= self.growth
+        weight = self.weight
+
+        # Only the orders whose context is complete are counted
+        for offset, modulus in self.layout[: self.seen]:
+            counts[offset + 3 * (context % modulus) + index] += weight
+
+        self.context = (3 * context + index) % self.layout[-1][1]
+        self.seen += 1
+
+        if weight > self.rescale_limit:
+            for position in range(len(counts)):
+                counts[position] /= weight
+            self.weight = 1.0
+
+    def next_move(self) -> Moves:
+        counts, context = self.counts, self.context
+        rock = paper = scissor = 0.0
+        order = 0
+
+        for offset, modulus in self.layout[: self.seen]:
+            position = offset + 3 * (context % modulus)
+            first, second, third = counts[position : position + 3]
+            total = first + second + third
+            order += 1
+
+            # Longer contexts are more specific, hence they get more weight
+            if total:
+                total /= order
+                rock += first / total
+                paper += second / total
+                scissor += third / total
+
+        return self.counter([rock, paper, scissor])
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+"""
+This module contains the regression checks of the ensemble strategy, which
+must not favour any move before it has learned anything about its opponent.
+"""
+
+from collections import Counter
+from unittest import TestCase, main
+
+from constants.moves import Moves
+from engine.match import MatchEngine
+from strategies.__strategies__ import create_strategy
+from strategies.basic import ConstantStrategy
+
+
+class EnsembleStrategyTest(TestCase):
+    def test_opening_move_is_unbiased(self):
+        counts = Counter(
+            create_strategy("ensemble", seed).next_move() for seed in range(300)
+        )
+
+        for move in Moves:
+            self.assertTrue(75 <= counts[move] <= 125, counts)
+
+    def test_moves_against_random_are_unbiased(self):
+        counts = Counter()
+
+        for seed in range(20):
+            ensemble = create_strategy("ensemble", seed)
+            opponent = create_strategy("random", seed, (1,))
+
+            for _ in range(500):
+                counts[ensemble.next_move()] += 1
+                ensemble.observe(opponent.next_move())
+
+        for move in Moves:
+            self.assertTrue(0.3 <= counts[move] / 10000 <= 0.37, counts)
+
+    def test_constant_opponent_is_beaten(self):
+        wins = Counter(
+            MatchEngine(3).play_match(
+                ConstantStrategy(None, Moves.SCISSOR),
+                create_strategy("ensemble", seed),
+            )
+            for seed in range(100)
+        )
+
+        self.assertGreater(wins[2], 90, wins)
+
+
+if __name__ == "__main__":
+    main()
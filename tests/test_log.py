@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+
+"""
+This module contains the regression checks of the log of rounds.
+"""
+
+from os.path import abspath, dirname
+from subprocess import run
+from sys import executable
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from engine.log import LogReader, MatchLog
+
+# Logs two matches of 10 and 5 rounds into segments of 10 rounds, then dies
+# with the last 5 rounds still buffered, i.e. right after the rollover
+crash = """
+from os import _exit
+from sys import argv
+from engine.log import MatchLog
+
+log = MatchLog(argv[1], segment_records=10, sync_interval=1000)
+
+for rounds in (10, 5):
+    log.begin_match()
+    for round_number in range(1, rounds + 1):
+        log.append(round_number, 1, 2, 2)
+
+_exit(0)
+"""
+
+
+class MatchLogTest(TestCase):
+    def test_match_ids_survive_crash_after_rollover(self):
+        with TemporaryDirectory() as directory:
+            run(
+                [executable, "-c", crash, directory],
+                cwd=dirname(dirname(abspath(__file__))),
+                check=True,
+            )
+
+            with MatchLog(directory, segment_records=10) as log:
+                self.assertEqual(log.begin_match(), 2)
+
+                for round_number in range(1, 4):
+                    log.append(round_number, 1, 2, 2)
+
+            with LogReader(directory) as reader:
+                self.assertEqual(
+                    [round.match_id for round in reader], [1] * 10 + [2] * 3
+                )
+                self.assertEqual(reader.match_rounds(1), range(0, 10))
+                self.assertEqual(reader.match_rounds(2), range(10, 13))
+
+
+if __name__ == "__main__":
+    main()
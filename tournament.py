@@ -0,0 +1,284 @@
+#!/usr/bin/python3
+
+"""
+Tournaments between the computer strategies of the Rock, Paper and Scissors
+game. The matches are played headlessly and spread over all the cores of the
+machine.
+"""
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from engine.match import MatchEngine
+from engine.rng import MoveSource
+from strategies.__strategies__ import strategies, create_strategy
+
+
+def play_matches(jobs: list) -> list:
+    """
+    This function is executed by the worker processes. It plays a chunk of
+    matches, where every job is a tuple of the indices and the names of
+    both the strategies, the number of rounds, the maximum number of rounds,
+    the seed of the tournament and the index of the match. Both strategies
+    of a match play with their own stream of the seed of the tournament.
+
+    This function returns a list of tuples of both the indices and the
+    winner of the match (i.e. 1, 2 or None for a tie).
+    """
+
+    results = list()
+
+    for first, second, first_name, second_name, rounds, max_rounds, seed, match in jobs:
+        engine = MatchEngine(rounds)
+        winner = engine.play_match(
+            create_strategy(first_name, seed, (match, 1)),
+            create_strategy(second_name, seed, (match, 2)),
+            max_rounds,
+        )
+        results.append((first, second, winner))
+
+    return results
+
+
+class Tournament:
+    """
+    Round robin and swiss tournaments between many strategies.
+
+    The results are aggregated in `matrix`, where `matrix[i][j]` holds the
+    number of wins, losses and ties of the i-th strategy against the j-th
+    strategy.
+    """
+
+    def __init__(
+        self,
+        strategy_names: list,
+        number_of_rounds: int,
+        matches_per_pairing: int = 1,
+        max_rounds: int = None,
+        workers: int = None,
+        chunk_size: int = None,
+        seed: int = None,
+    ):
+        assert len(strategy_names) >= 2, "At least two strategies are required"
+        assert number_of_rounds > 0, "Invalid Number Of Rounds"
+        assert matches_per_pairing > 0, "Invalid Number Of Matches"
+
+        for name in strategy_names:
+            assert name in strategies, f"Unknown Strategy [{name=}]"
+
+        self.strategy_names = list(strategy_names)
+        self.number_of_rounds = number_of_rounds
+        self.matches_per_pairing = matches_per_pairing
+        # Matches between strategies which never beat each other, such as
+        # two constant strategies, are declared a tie after max_rounds
+        self.max_rounds = max_rounds or 100 * number_of_rounds
+        self.workers = workers or cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.seed = MoveSource(seed).seed_value
+        self.matches = 0
+
+        size = len(self.strategy_names)
+        self.matrix = [[[0, 0, 0] for _ in range(size)] for _ in range(size)]
+        self.points = [0.0] * size
+
+    def __jobs__(self, pairings: list) -> list:
+        """
+        This method creates the jobs of all the matches of the pairings.
+        """
+
+        jobs = [
+            (
+                first,
+                second,
+                self.strategy_names[first],
+                self.strategy_names[second],
+                self.number_of_rounds,
+                self.max_rounds,
+                self.seed,
+                self.matches + match,
+            )
+            for match, (first, second) in enumerate(
+                pairing for pairing in pairings for _ in range(self.matches_per_pairing)
+            )
+        ]
+
+        self.matches += len(jobs)
+
+        return jobs
+
+    def __record__(self, first: int, second: int, winner: int):
+        """
+        This method adds the result of a single match to the matrix and the
+        points of both the strategies.
+        """
+
+        if winner == 1:
+            self.matrix[first][second][0] += 1
+            self.matrix[second][first][1] += 1
+            self.points[first] += 1
+        elif winner == 2:
+            self.matrix[first][second][1] += 1
+            self.matrix[second][first][0] += 1
+            self.points[second] += 1
+        else:
+            self.matrix[first][second][2] += 1
+            self.matrix[second][first][2] += 1
+            self.points[first] += 0.5
+            self.points[second] += 0.5
+
+    def __play__(self, executor: ProcessPoolExecutor, pairings: list):
+        """
+        This method plays all the matches of the pairings, split into chunks
+        which are scheduled on the worker processes.
+        """
+
+        jobs = self.__jobs__(pairings)
+
+        # A few chunks per worker balance the load without paying the
+        # inter-process overhead for every single match
+        chunk_size = self.chunk_size or max(1, -(-len(jobs) // (4 * self.workers)))
+        chunks = [jobs[i : i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+
+        for results in executor.map(play_matches, chunks):
+            for first, second, winner in results:
+                self.__record__(first, second, winner)
+
+    def round_robin(self):
+        """
+        This method plays a round robin tournament, i.e. every strategy
+        plays against every other strategy.
+        """
+
+        size = len(self.strategy_names)
+        pairings = [
+            (first, second)
+            for first in range(size)
+            for second in range(first + 1, size)
+        ]
+
+        with ProcessPoolExecutor(self.workers) as executor:
+            self.__play__(executor, pairings)
+
+    def swiss(self, rounds: int):
+        """
+        This method plays a swiss tournament of the given number of rounds.
+        In every round the strategies are sorted by their points and paired
+        with the next strategy they have not played against yet. If the
+        number of strategies is odd, the last unpaired strategy gets a bye
+        which is worth a win.
+        """
+
+        size = len(self.strategy_names)
+        played = set()
+
+        with ProcessPoolExecutor(self.workers) as executor:
+            for _ in range(rounds):
+                standings = sorted(range(size), key=lambda i: (-self.points[i], i))
+                pairings = list()
+
+                while len(standings) > 1:
+                    first = standings.pop(0)
+                    second = next(
+                        (i for i in standings if (first, i) not in played),
+                        standings[0],
+                    )
+                    standings.remove(second)
+                    played.update(((first, second), (second, first)))
+                    pairings.append((first, second))
+
+                if standings:
+                    self.points[standings[0]] += self.matches_per_pairing
+
+                self.__play__(executor, pairings)
+
+    def standings(self) -> list:
+        """
+        This method returns the names of the strategies along with their
+        points, sorted from the best to the worst.
+        """
+
+        return sorted(
+            zip(self.strategy_names, self.points), key=lambda item: -item[1]
+        )
+
+    def format_matrix(self) -> str:
+        """
+        This method returns the win/loss/tie matrix as a printable table.
+        """
+
+        cells = [
+            [
+                "-" if i == j else "/".join(map(str, self.matrix[i][j]))
+                for j in range(len(self.strategy_names))
+            ]
+            for i in range(len(self.strategy_names))
+        ]
+        width = max(
+            max(map(len, self.strategy_names)),
+            max(len(cell) for row in cells for cell in row),
+        )
+
+        lines = [" ".join(name.rjust(width) for name in ["", *self.strategy_names])]
+        for name, row in zip(self.strategy_names, cells):
+            lines.append(" ".join(cell.rjust(width) for cell in [name, *row]))
+
+        return "\n".join(lines)
+
+
+def main():
+    """
+    Command line entry point of the tournament runner.
+    """
+
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "strategies",
+        nargs="*",
+        default=list(strategies),
+        help=f"the strategies taking part, out of {', '.join(strategies)}",
+    )
+    parser.add_argument("--rounds", type=int, default=10, help="wins per match")
+    parser.add_argument(
+        "--matches", type=int, default=10, help="matches per pairing"
+    )
+    parser.add_argument(
+        "--max-rounds", type=int, default=None, help="rounds before a tie"
+    )
+    parser.add_argument(
+        "--format", choices=("round-robin", "swiss"), default="round-robin"
+    )
+    parser.add_argument(
+        "--swiss-rounds", type=int, default=5, help="rounds of a swiss tournament"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    arguments = parser.parse_args()
+
+    for name in arguments.strategies:
+        if name not in strategies:
+            parser.error(f"unknown strategy {name!r}")
+
+    tournament = Tournament(
+        arguments.strategies,
+        arguments.rounds,
+        arguments.matches,
+        arguments.max_rounds,
+        arguments.workers,
+        arguments.chunk_size,
+        arguments.seed,
+    )
+
+    if arguments.format == "swiss":
+        tournament.swiss(arguments.swiss_rounds)
+    else:
+        tournament.round_robin()
+
+    print(tournament.format_matrix())
+    print()
+    for name, points in tournament.standings():
+        print(f"{name} : {points:g}")
+
+
+if __name__ == "__main__":
+    main()